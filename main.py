@@ -15,12 +15,16 @@ CLI Arguments:
     --no_gcs_export         : Skip GCS export
     --schedule              : Run as scheduled service (continuous loop)
 """
+import os
 import sys
-import io
+import time
 import asyncio
+import math
 import logging
 import argparse
-from datetime import datetime, timezone, timedelta
+from collections import defaultdict
+from functools import lru_cache
+from datetime import date, datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional, Tuple, Set
 
 from src.config import Config
@@ -28,16 +32,26 @@ from src.fetchers import ApplovinFetcher, FetcherFactory
 from src.notifiers import SlackNotifier
 from src.exporters import GCSExporter
 from src.enums import NetworkName
+from src.utils import get_dates_with_data, parse_delta_percentage, exceeds_threshold
 
-# Configure logging
+# Configure logging (NDVS_LOG_LEVEL=WARNING skips formatting of info/debug records)
+_log_level_name = os.environ.get('NDVS_LOG_LEVEL', 'INFO').upper()
+_log_level = logging.getLevelNamesMapping().get(_log_level_name)
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.INFO if _log_level is None else _log_level,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+if _log_level is None:
+    logger.warning(f"Invalid NDVS_LOG_LEVEL {_log_level_name!r}, using INFO")
 
-# Fix console encoding for Windows
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Console banner rule
+_BAR = "=" * 70
+
+# Fix console encoding for Windows (other platforms already use UTF-8)
+if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 
 # =============================================================================
@@ -100,39 +114,35 @@ def _calculate_delta(max_val: float, network_val: float) -> str:
     return f"{sign}{delta:.1f}%"
 
 
-def _get_last_available_date(daily_data: Dict[str, Any]) -> Optional[str]:
+def _parse_finite_delta(val: Any) -> float:
+    """Parse a delta value for export; ∞, N/A and unparseable values become 0.0."""
+    if isinstance(val, (int, float)):
+        return float(val)
+    if not isinstance(val, str):
+        return 0.0
+    delta = parse_delta_percentage(val)
+    return delta if math.isfinite(delta) else 0.0
+
+
+@lru_cache(maxsize=None)
+def _get_gcs_exporter(
+    project_id: str,
+    bucket_name: str,
+    service_account_path: Optional[str],
+    base_path: str
+) -> GCSExporter:
     """
-    Find the last date with valid data (impressions > 0) from daily_data.
+    Return a GCSExporter for the given settings, reused across scheduled runs.
     
-    Args:
-        daily_data: Dictionary with date keys containing platform/ad_type data
-        
-    Returns:
-        Last date string (YYYY-MM-DD) with valid data, or None if no data
+    The exporter lazily creates (and then keeps) its storage client, so
+    reusing it avoids reloading credentials on every run.
     """
-    if not daily_data:
-        return None
-    
-    valid_dates = []
-    for date_str, date_data in daily_data.items():
-        # Check if any platform/ad_type has impressions > 0
-        has_data = False
-        for platform_data in date_data.values():
-            if isinstance(platform_data, dict):
-                for ad_data in platform_data.values():
-                    if isinstance(ad_data, dict) and ad_data.get('impressions', 0) > 0:
-                        has_data = True
-                        break
-            if has_data:
-                break
-        if has_data:
-            valid_dates.append(date_str)
-    
-    if not valid_dates:
-        return None
-    
-    # Return the latest valid date
-    return sorted(valid_dates)[-1]
+    return GCSExporter(
+        project_id=project_id,
+        bucket_name=bucket_name,
+        service_account_path=service_account_path,
+        base_path=base_path
+    )
 
 
 def _create_comparison_rows(
@@ -323,13 +333,13 @@ async def run_validation(
     Returns:
         Result dictionary with success status and data
     """
-    print(f"\n{'=' * 70}")
+    print(f"\n{_BAR}")
     print(f"📊 NETWORK DATA VALIDATION SYSTEM")
-    print(f"{'=' * 70}")
+    print(_BAR)
     print(f"📅 Date Range: {start_date.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')}")
     print(f"🔕 Slack: {'Disabled' if no_slack else 'Enabled'}")
     print(f"☁️  GCS Export: {'Disabled' if no_gcs else 'Enabled'}")
-    print(f"{'=' * 70}")
+    print(_BAR)
     
     # Initialize AppLovin fetcher
     applovin_config = config.get_applovin_config()
@@ -398,14 +408,13 @@ async def run_validation(
             data = await fetcher.fetch_data(start_date, end_date)
             daily_data = data.get('daily_data', {})
             
-            # Find last_available_date (last date with valid data)
-            last_date = _get_last_available_date(daily_data)
+            # Find last_available_date (last date with valid data) - one
+            # pass over daily_data yields both the date and the day count
+            dates_with_data = get_dates_with_data(daily_data)
+            last_date = dates_with_data[-1] if dates_with_data else None
             
             if last_date:
-                days_with_data = len([d for d, v in daily_data.items() 
-                                      if any(p.get(a, {}).get('impressions', 0) > 0 
-                                            for p in v.values() if isinstance(p, dict)
-                                            for a in p.keys() if isinstance(p.get(a), dict))])
+                days_with_data = len(dates_with_data)
                 print(f"   ✅ {network_key}: ${data.get('revenue', 0):.2f} revenue, {data.get('impressions', 0):,} impressions")
                 print(f"      📅 last_available_date: {last_date} ({days_with_data} days with data)")
             else:
@@ -450,11 +459,11 @@ async def run_validation(
         if gcp_config and gcp_config.get('enabled') and all_comparison_rows:
             print(f"\n☁️  Step 4: Exporting to GCS...")
             try:
-                exporter = GCSExporter(
-                    project_id=gcp_config['project_id'],
-                    bucket_name=gcp_config['bucket_name'],
-                    service_account_path=gcp_config.get('service_account_path'),
-                    base_path=gcp_config.get('base_path', 'network_data')
+                exporter = _get_gcs_exporter(
+                    gcp_config['project_id'],
+                    gcp_config['bucket_name'],
+                    gcp_config.get('service_account_path'),
+                    gcp_config.get('base_path', 'network_data')
                 )
                 
                 gcs_files = exporter.export_multi_day(all_comparison_rows)
@@ -535,12 +544,15 @@ async def run_validation(
             
             # Build network_summary: per-network totals at their last_available_date
             network_summary = {}
+            # Group rows by (network, date) once instead of rescanning every
+            # row for each network
+            rows_by_network_date = defaultdict(list)
+            for r in slack_comparison_rows:
+                rows_by_network_date[(r.get('network_key'), r.get('date'))].append(r)
+            
             for network_key, last_date in last_available_dates.items():
                 # Get rows for this network at its last_available_date
-                network_rows = [
-                    r for r in slack_comparison_rows 
-                    if r.get('network_key') == network_key and r.get('date') == last_date
-                ]
+                network_rows = rows_by_network_date.get((network_key, last_date))
                 if network_rows:
                     max_rev = sum(r.get('max_revenue', 0) for r in network_rows)
                     net_rev = sum(r.get('network_revenue', 0) or 0 for r in network_rows)
@@ -558,31 +570,15 @@ async def run_validation(
                             net_ecpm = row.get('network_ecpm', 0) or 0
                             ecpm_delta = ((net_ecpm - max_ecpm) / max_ecpm * 100) if max_ecpm > 0 else 0
                             
-                            # Parse delta values safely (handle ∞, N/A, etc.)
-                            def parse_delta(val):
-                                if val is None:
-                                    return 0.0
-                                if isinstance(val, (int, float)):
-                                    return float(val)
-                                if isinstance(val, str):
-                                    val = val.replace('%', '').replace('+', '').strip()
-                                    if val in ('∞', 'N/A', '-∞', 'inf', '-inf', ''):
-                                        return 0.0
-                                    try:
-                                        return float(val)
-                                    except ValueError:
-                                        return 0.0
-                                return 0.0
-                            
                             placement_breakdown.append({
                                 'application': row.get('application', ''),
                                 'ad_type': row.get('ad_type', ''),
                                 'max_impressions': row.get('max_impressions', 0),
                                 'network_impressions': row.get('network_impressions', 0) or 0,
-                                'imp_delta': parse_delta(row.get('imp_delta')),
+                                'imp_delta': _parse_finite_delta(row.get('imp_delta')),
                                 'max_revenue': row.get('max_revenue', 0),
                                 'network_revenue': row.get('network_revenue', 0) or 0,
-                                'rev_delta': parse_delta(row.get('rev_delta')),
+                                'rev_delta': _parse_finite_delta(row.get('rev_delta')),
                                 'max_ecpm': max_ecpm,
                                 'network_ecpm': net_ecpm,
                                 'ecpm_delta': ecpm_delta,
@@ -600,7 +596,7 @@ async def run_validation(
                         'rev_delta': rev_delta,
                         'imp_delta': imp_delta,
                         'row_count': len(network_rows),
-                        'threshold_exceeded': abs(rev_delta) > threshold,
+                        'threshold_exceeded': exceeds_threshold(rev_delta, threshold),
                         'placement_breakdown': placement_breakdown,
                     }
             
@@ -630,7 +626,19 @@ async def run_validation(
             end_date_network_total = 0
             end_date_network_imps = 0
             networks_with_end_date_data = []
+            # Legacy totals for backward compatibility (sum of all network_summary),
+            # accumulated in the same pass over the summaries
+            totals = {
+                'max_revenue': 0,
+                'network_revenue': 0,
+                'max_impressions': 0,
+                'network_impressions': 0,
+            }
             for network_key, summary in network_summary.items():
+                totals['max_revenue'] += summary['max_revenue']
+                totals['network_revenue'] += summary['network_revenue']
+                totals['max_impressions'] += summary['max_impressions']
+                totals['network_impressions'] += summary['network_impressions']
                 if summary['last_available_date'] == end_date_str:
                     end_date_network_total += summary['network_revenue']
                     end_date_network_imps += summary['network_impressions']
@@ -645,14 +653,6 @@ async def run_validation(
                 'networks_with_data': networks_with_end_date_data,
             }
             
-            # Legacy totals for backward compatibility (sum of all network_summary)
-            totals = {
-                'max_revenue': sum(s['max_revenue'] for s in network_summary.values()),
-                'network_revenue': sum(s['network_revenue'] for s in network_summary.values()),
-                'max_impressions': sum(s['max_impressions'] for s in network_summary.values()),
-                'network_impressions': sum(s['network_impressions'] for s in network_summary.values()),
-            }
-            
             # Include failed networks and last_available_dates in network_data for Slack
             network_data_for_slack = dict(network_data)
             if failed_networks:
@@ -691,9 +691,9 @@ async def run_validation(
         print(f"\n📤 Step 6: Slack notification skipped (--no_slack_message)")
     
     # Summary
-    print(f"\n{'=' * 70}")
+    print(f"\n{_BAR}")
     print(f"✅ VALIDATION COMPLETE")
-    print(f"{'=' * 70}")
+    print(_BAR)
     print(f"   📊 MAX rows: {len(max_rows)}")
     print(f"   📊 Comparison rows (GCS): {len(all_comparison_rows)}")
     print(f"   📊 Comparison rows (Slack): {len(slack_comparison_rows)}")
@@ -702,9 +702,9 @@ async def run_validation(
         print(f"   ❌ Networks failed: {', '.join(failed_networks)}")
     if last_available_dates:
         print(f"   📅 Last available dates:")
-        for net, date in sorted(last_available_dates.items()):
-            print(f"      - {net}: {date}")
-    print(f"{'=' * 70}\n")
+        for net, last_date in sorted(last_available_dates.items()):
+            print(f"      - {net}: {last_date}")
+    print(f"{_BAR}\n")
     
     return {
         'success': True,
@@ -717,6 +717,20 @@ async def run_validation(
     }
 
 
+def _parse_date_arg(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD command line date as midnight UTC.
+    
+    Used as an argparse type, so malformed dates are rejected before any
+    config loading or API work.
+    """
+    try:
+        parsed = date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+    return datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc)
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -734,13 +748,13 @@ Examples:
     
     parser.add_argument(
         '--start_date',
-        type=str,
+        type=_parse_date_arg,
         help='Start date (YYYY-MM-DD). Default: end_date - 7 days'
     )
     
     parser.add_argument(
         '--end_date',
-        type=str,
+        type=_parse_date_arg,
         help='End date (YYYY-MM-DD). Default: UTC now - 1 day'
     )
     
@@ -772,13 +786,13 @@ def run_single_validation(config: Config, args) -> bool:
     
     # End date: default to yesterday (UTC now - 1)
     if args.end_date:
-        end_date = datetime.strptime(args.end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        end_date = args.end_date
     else:
         end_date = now_utc - timedelta(days=1)
     
     # Start date: default to end_date - 7 days
     if args.start_date:
-        start_date = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        start_date = args.start_date
     else:
         start_date = end_date - timedelta(days=7)
     
@@ -806,8 +820,6 @@ def run_scheduled(config: Config, args):
     Run validation on a schedule (continuous loop).
     Checks scheduled times from config and runs validation when time matches.
     """
-    import time as time_module
-    
     scheduled_times = config.get_scheduled_times()
     interval_hours = config.get_scheduling_interval_hours()
     
@@ -840,7 +852,7 @@ def run_scheduled(config: Config, args):
                 
                 try:
                     # Reload config in case it changed
-                    config = Config()
+                    config.reload()
                     success = run_single_validation(config, args)
                     
                     if success:
@@ -855,7 +867,7 @@ def run_scheduled(config: Config, args):
                 print(f"\n💤 Waiting for next scheduled time...")
             
             # Sleep for 30 seconds before checking again
-            time_module.sleep(30)
+            time.sleep(30)
             
         except KeyboardInterrupt:
             print(f"\n\n🛑 Scheduled service stopped by user")
@@ -863,13 +875,13 @@ def run_scheduled(config: Config, args):
         except Exception as e:
             print(f"\n❌ Scheduler error: {str(e)}")
             logger.exception("Scheduler error")
-            time_module.sleep(60)  # Wait a bit before retrying
+            time.sleep(60)  # Wait a bit before retrying
 
 
 def main():
     """Main entry point."""
     print("Network Data Validation System")
-    print("=" * 70)
+    print(_BAR)
     
     # Parse arguments
     args = parse_args()
@@ -9,11 +9,9 @@ import signal
 import subprocess
 import psutil
 
-# Add src to path for imports
+# Running this file puts its directory first on sys.path already, so the
+# src package imports without any path manipulation
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, BASE_DIR)
-
-from src.config import Config
 
 # Paths
 PID_FILE = os.path.join(BASE_DIR, "service.pid")
@@ -24,6 +22,8 @@ MAIN_SCRIPT = os.path.join(BASE_DIR, "main.py")
 def get_scheduling_info():
     """Get scheduling info from config."""
     try:
+        # Imported here so stop/logs/help don't pay for loading the config stack
+        from src.config import Config
         config = Config()
         interval_hours = config.get_scheduling_interval_hours()
         scheduled_times = config.get_scheduled_times()
@@ -3,7 +3,19 @@ Configuration loader for the Network Data Validation System.
 """
 import yaml
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Tuple
+
+try:
+    # libyaml-backed loader, much faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed YAML keyed by absolute path -> (mtime_ns, size, data).
+# Repeated Config() constructions (scheduler runs, service status checks,
+# test scripts) reuse the parsed document until the file changes on disk.
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
 
 
 class Config:
@@ -18,6 +30,31 @@ class Config:
         """
         self.config_path = config_path
         self.config = self._load_config()
+        # Values derived from self.config (parsed thresholds, schedule),
+        # computed on first access and dropped by reload()
+        self._derived: Dict[str, Any] = {}
+    
+    def reload(self) -> None:
+        """Re-read the configuration file and drop derived values."""
+        self.config = self._load_config()
+        self._derived.clear()
+    
+    def _get_derived(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a derived value, computing it once per loaded configuration.
+        
+        Args:
+            name: Cache key for the value
+            compute: Function computing the value from self.config
+            
+        Returns:
+            The cached or freshly computed value
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = compute()
+            return value
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
@@ -27,8 +64,17 @@ class Config:
                 f"Please copy config.yaml.example to config.yaml and configure it."
             )
         
+        abs_path = os.path.abspath(self.config_path)
+        stat = os.stat(abs_path)
+        cached = _CONFIG_CACHE.get(abs_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
         with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
+        
+        _CONFIG_CACHE[abs_path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -68,8 +114,10 @@ class Config:
         Returns:
             Threshold percentage (default: 5.0)
         """
-        slack_config = self.get_slack_config()
-        return float(slack_config.get('revenue_delta_threshold', 5.0))
+        return self._get_derived(
+            'revenue_delta_threshold',
+            lambda: float(self.get_slack_config().get('revenue_delta_threshold', 5.0))
+        )
     
     def get_slack_min_revenue_for_alerts(self) -> float:
         """
@@ -80,8 +128,10 @@ class Config:
         Returns:
             Minimum revenue in dollars (default: 25.0)
         """
-        slack_config = self.get_slack_config()
-        return float(slack_config.get('min_revenue_for_alerts', 25.0))
+        return self._get_derived(
+            'min_revenue_for_alerts',
+            lambda: float(self.get_slack_config().get('min_revenue_for_alerts', 25.0))
+        )
     
     def get_validation_config(self) -> Dict[str, Any]:
         """Get validation/report settings."""
@@ -118,6 +168,11 @@ class Config:
         Returns:
             List of times in HH:MM format (e.g., ["00:00", "03:00", "06:00", ...])
         """
+        # Copy so callers can't mutate the cached schedule
+        return list(self._get_derived('scheduled_times', self._compute_scheduled_times))
+    
+    def _compute_scheduled_times(self) -> List[str]:
+        """Build the sorted list of scheduled run times."""
         interval_hours = self.get_scheduling_interval_hours()
         start_time = self.get_scheduling_start_time()
         
@@ -5,6 +5,7 @@ Exports comparison data to GCS in Parquet format for BigQuery analysis.
 import io
 import os
 import tempfile
+from collections import defaultdict
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -143,9 +144,12 @@ class GCSExporter:
         imp_deltas = []
         ecpm_deltas = []
         hour_ranges = []
-        fetched_ats = []
         
         fetched_at = datetime.utcnow()
+        fallback_date = report_date.date()
+        parse_delta = self._parse_delta
+        # Rows span only a handful of distinct dates - parse each one once
+        parsed_dates: Dict[str, Any] = {}
         
         for row in comparison_rows:
             # Parse application to extract platform
@@ -159,12 +163,15 @@ class GCSExporter:
             # Use row's date if available, otherwise fall back to report_date
             row_date = row.get('date')
             if row_date:
-                try:
-                    parsed_date = datetime.strptime(row_date, '%Y-%m-%d').date()
-                except ValueError:
-                    parsed_date = report_date.date()
+                parsed_date = parsed_dates.get(row_date)
+                if parsed_date is None:
+                    try:
+                        parsed_date = datetime.fromisoformat(row_date).date()
+                    except ValueError:
+                        parsed_date = fallback_date
+                    parsed_dates[row_date] = parsed_date
             else:
-                parsed_date = report_date.date()
+                parsed_date = fallback_date
             
             dates.append(parsed_date)
             networks.append(network)
@@ -177,11 +184,10 @@ class GCSExporter:
             network_revenues.append(float(row.get('network_revenue', 0) or 0))
             network_impressions_list.append(int(row.get('network_impressions', 0) or 0))
             network_ecpms.append(float(row.get('network_ecpm', 0) or 0))
-            rev_deltas.append(self._parse_delta(row.get('rev_delta', '')))
-            imp_deltas.append(self._parse_delta(row.get('imp_delta', '')))
-            ecpm_deltas.append(self._parse_delta(row.get('cpm_delta', '')))
+            rev_deltas.append(parse_delta(row.get('rev_delta', '')))
+            imp_deltas.append(parse_delta(row.get('imp_delta', '')))
+            ecpm_deltas.append(parse_delta(row.get('cpm_delta', '')))
             hour_ranges.append(row.get('hour_range'))  # Only Meta has this field
-            fetched_ats.append(fetched_at)
         
         # Create PyArrow arrays
         table = pa.table({
@@ -200,7 +206,11 @@ class GCSExporter:
             'imp_delta_pct': pa.array(imp_deltas, type=pa.float64()),
             'ecpm_delta_pct': pa.array(ecpm_deltas, type=pa.float64()),
             'hour_range': pa.array(hour_ranges, type=pa.string()),
-            'fetched_at': pa.array(fetched_ats, type=pa.timestamp('us')),
+            # Same value on every row - repeat one scalar instead of
+            # converting a list of identical Python datetimes
+            'fetched_at': pa.repeat(
+                pa.scalar(fetched_at, type=pa.timestamp('us')), len(dates)
+            ),
         })
         
         return table
@@ -486,7 +496,7 @@ class GCSExporter:
         Returns:
             Dictionary with keys like 'unity_android' and values as row lists
         """
-        grouped = {}
+        grouped = defaultdict(list)
         for row in comparison_rows:
             app_name = row.get('application', '')
             platform = 'android' if 'Android' in app_name else 'ios' if 'iOS' in app_name else 'unknown'
@@ -494,12 +504,9 @@ class GCSExporter:
             network = row.get('network', '').lower()
             network = network.replace(' bidding', '').replace(' ads', '').strip()
             
-            key = f"{network}_{platform}"
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(row)
+            grouped[f"{network}_{platform}"].append(row)
         
-        return grouped
+        return dict(grouped)
     
     def export(
         self,
@@ -539,6 +546,10 @@ class GCSExporter:
         to its own partition. When only_networks is specified, performs merge
         with existing data to preserve other networks' data.
         
+        Dates are exported one at a time. If any date fails, the remaining
+        dates are still exported and a RuntimeError naming the failed dates
+        is raised after the per-date summary is printed in date order.
+        
         Args:
             comparison_rows: List of comparison dictionaries (must have 'date' field)
             dry_run: If True, export to local files; if False, upload to GCS
@@ -563,24 +574,48 @@ class GCSExporter:
         if only_networks:
             print(f"   🔗 Partial update mode for networks: {only_networks}")
         
-        all_results = []
+        partitions = []
         for date_str, date_rows in sorted(rows_by_date.items()):
             # Parse date string to datetime
             try:
-                report_date = datetime.strptime(date_str, '%Y-%m-%d')
+                report_date = datetime.fromisoformat(date_str)
             except ValueError:
                 print(f"⚠️  Skipping invalid date: {date_str}")
                 continue
             
             print(f"   📆 {date_str}: {len(date_rows)} rows")
-            
-            if dry_run:
-                results = self.export_to_local(date_rows, report_date, output_dir)
-            else:
-                results = self.export_to_gcs(date_rows, report_date, only_networks=only_networks)
-            
+            partitions.append((date_rows, report_date))
+        
+        # Partitions are independent, so a failed date does not stop the
+        # others; failures are collected and reported together at the end
+        all_results = []
+        failures = {}
+        for date_rows, report_date in partitions:
+            date_str = report_date.strftime('%Y-%m-%d')
+            try:
+                if dry_run:
+                    results = self.export_to_local(date_rows, report_date, output_dir)
+                else:
+                    results = self.export_to_gcs(date_rows, report_date, only_networks=only_networks)
+            except Exception as e:
+                print(f"   ❌ {date_str}: export failed: {e}")
+                failures[date_str] = e
+                continue
             all_results.extend(results)
         
+        print(f"📋 Export summary: {len(partitions) - len(failures)}/{len(partitions)} dates exported")
+        for date_rows, report_date in partitions:
+            date_str = report_date.strftime('%Y-%m-%d')
+            if date_str in failures:
+                print(f"   ❌ {date_str}: {failures[date_str]}")
+            else:
+                print(f"   ✅ {date_str}")
+        if failures:
+            raise RuntimeError(
+                f"Export failed for {len(failures)} of {len(partitions)} dates: "
+                f"{', '.join(failures)}"
+            )
+        
         return all_results
 
     def _group_by_date(
@@ -596,17 +631,13 @@ class GCSExporter:
         Returns:
             Dictionary with date strings (YYYY-MM-DD) as keys and row lists as values
         """
-        grouped = {}
+        grouped = defaultdict(list)
         for row in comparison_rows:
             date_str = row.get('date')
-            if not date_str:
-                continue
-            
-            if date_str not in grouped:
-                grouped[date_str] = []
-            grouped[date_str].append(row)
+            if date_str:
+                grouped[date_str].append(row)
         
-        return grouped
+        return dict(grouped)
 
 
 def create_exporter_from_config(config: Dict[str, Any]) -> Optional[GCSExporter]:
@@ -112,7 +112,7 @@ class AdmobFetcher(NetworkDataFetcher):
         if os.path.exists(self.token_path):
             try:
                 creds = Credentials.from_authorized_user_file(self.token_path, self.SCOPES)
-                logger.debug(f"Loaded existing OAuth token from {self.token_path}")
+                logger.debug("Loaded existing OAuth token from %s", self.token_path)
             except Exception as e:
                 logger.warning(f"Failed to load token: {e}")
                 creds = None
@@ -171,7 +171,7 @@ class AdmobFetcher(NetworkDataFetcher):
             
             with open(self.token_path, 'w') as token_file:
                 token_file.write(creds.to_json())
-            logger.debug(f"OAuth token saved to {self.token_path}")
+            logger.debug("OAuth token saved to %s", self.token_path)
         except Exception as e:
             logger.warning(f"Failed to save token: {e}")
     
@@ -201,7 +201,7 @@ class AdmobFetcher(NetworkDataFetcher):
             accounts_response = self.service.accounts().list().execute()
             accounts = accounts_response.get('account', [])
             
-            logger.debug(f"Found {len(accounts)} AdMob account(s)")
+            logger.debug("Found %d AdMob account(s)", len(accounts))
             
             if not accounts:
                 raise Exception(
@@ -214,7 +214,7 @@ class AdmobFetcher(NetworkDataFetcher):
                 account_name = account.get('name', '')
                 publisher_id = account.get('publisherId', '')
                 
-                logger.debug(f"Account: {account_name}, Publisher: {publisher_id}")
+                logger.debug("Account: %s, Publisher: %s", account_name, publisher_id)
                 
                 # Match by publisher ID (with or without pub- prefix)
                 if self.publisher_id in publisher_id or publisher_id.replace('pub-', '') == self.publisher_id:
@@ -311,7 +311,7 @@ class AdmobFetcher(NetworkDataFetcher):
                     if 'row' in item:
                         rows.append(item['row'])
             
-            logger.debug(f"Retrieved {len(rows)} rows from AdMob")
+            logger.debug("Retrieved %d rows from AdMob", len(rows))
             
             for row in rows:
                 revenue, impressions = self._process_row(row, ad_data, platform_data, daily_data)
@@ -376,15 +376,11 @@ class AdmobFetcher(NetworkDataFetcher):
             
             # Accumulate daily breakdown if daily_data is provided
             if daily_data is not None:
-                if date_key not in daily_data:
-                    daily_data[date_key] = {}
-                if platform.value not in daily_data[date_key]:
-                    daily_data[date_key][platform.value] = {}
-                if ad_type.value not in daily_data[date_key][platform.value]:
-                    daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-                
-                daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-                daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
+                self._accumulate_daily(
+                    daily_data, date_key,
+                    platform, ad_type,
+                    revenue, impressions
+                )
             
             return (revenue, impressions)
             
@@ -246,14 +246,14 @@ class ApplovinFetcher(NetworkDataFetcher):
                     used_columns = columns
                     break
             except Exception as e:
-                logger.debug(f"AppLovin column set failed: {str(e)}")
+                logger.debug("AppLovin column set failed: %s", e)
                 continue
         
         if data is None:
             raise Exception("Failed to fetch data from AppLovin Max API - all column sets failed")
 
         rows = data.get('results') or data.get('data') or data.get('rows') or []
-        logger.debug(f"AppLovin retrieved {len(rows)} rows")
+        logger.debug("AppLovin retrieved %d rows", len(rows))
         
         # Check if we have network comparison data
         has_network_data = used_columns and ('third_party' in used_columns or 'network_estimated' in used_columns)
@@ -269,6 +269,9 @@ class ApplovinFetcher(NetworkDataFetcher):
             'network_impressions': 0
         }
         
+        # Date used for rows without a date, formatted once
+        fallback_date_key = start_date.strftime('%Y-%m-%d')
+        
         for row in rows:
             app_name = row.get('application', row.get('package_name', 'Unknown'))
             
@@ -279,7 +282,7 @@ class ApplovinFetcher(NetworkDataFetcher):
             # Get date from 'day' column (format: YYYY-MM-DD)
             date_str = row.get('day', '')
             if not date_str:
-                date_str = start_date.strftime('%Y-%m-%d')
+                date_str = fallback_date_key
             
             platform = self._detect_platform(row)
             application = self._get_app_display_name(app_name, platform)
@@ -4,6 +4,7 @@ Provides common methods and async support for all network fetchers.
 """
 import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List, Any, Optional, TypedDict
@@ -13,12 +14,14 @@ import aiohttp
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log
+    retry_if_exception,
+    before_sleep_log,
+    RetryCallState
 )
 
 from ..enums import Platform, AdType, NetworkName
+from ..utils.response_cache import ResponseCache
+from ..utils.json_utils import json_loads
 
 
 logger = logging.getLogger(__name__)
@@ -81,15 +84,51 @@ class NetworkDataFetcher(ABC):
     # HTTP timeout settings
     DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
     
-    def __init__(self, retry_config: Optional[RetryConfig] = None):
+    # Headers sent with every request on the session - override in subclass
+    DEFAULT_HEADERS: Dict[str, str] = {}
+    
+    # HTTP statuses worth retrying - other 4xx (bad request, auth) fail fast
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    
+    # Max bytes of an error response body included in exception messages
+    ERROR_PREVIEW_BYTES = 500
+    
+    # Connection pool settings - bound fan-out (e.g. per-window or per-day
+    # requests) so a single fetcher cannot exhaust sockets or trip throttling
+    DEFAULT_MAX_CONCURRENCY = 64
+    DEFAULT_CONNECTION_LIMIT = 100
+    DNS_CACHE_TTL_SECONDS = 300
+    
+    # Minimum seconds between request starts, retries included - set in
+    # subclasses whose API enforces a QPS limit. 0 disables the limiter
+    MIN_REQUEST_INTERVAL = 0.0
+    
+    def __init__(
+        self,
+        retry_config: Optional[RetryConfig] = None,
+        max_concurrency: Optional[int] = None,
+        connection_limit: Optional[int] = None
+    ):
         """
         Initialize base fetcher.
         
         Args:
             retry_config: Optional retry configuration
+            max_concurrency: Maximum in-flight requests (also the per-host
+                connection limit). Defaults to DEFAULT_MAX_CONCURRENCY
+            connection_limit: Total connection pool size.
+                Defaults to DEFAULT_CONNECTION_LIMIT
         """
         self.retry_config = retry_config or self.DEFAULT_RETRY_CONFIG
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.connection_limit = connection_limit or self.DEFAULT_CONNECTION_LIMIT
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Shared start-rate limiter state (see _wait_for_request_slot)
+        self._request_slot_lock = asyncio.Lock()
+        self._next_request_at = 0.0
         self._session: Optional[aiohttp.ClientSession] = None
+        # Opt-in (NDVS_TEST_CACHE=1) response cache for iterative test runs
+        self._response_cache: Optional[ResponseCache] = ResponseCache.from_env()
     
     async def __aenter__(self):
         """Async context manager entry - create session."""
@@ -344,9 +383,25 @@ class NetworkDataFetcher(ABC):
     # =========================================================================
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """
+        Get or create aiohttp session.
+        
+        Response compression is negotiated by aiohttp itself: every request
+        advertises 'Accept-Encoding: gzip, deflate', plus 'br' when the
+        Brotli package is installed. Fetchers must not override the
+        Accept-Encoding header, or report payloads arrive uncompressed.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.DEFAULT_TIMEOUT)
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.max_concurrency,
+                ttl_dns_cache=self.DNS_CACHE_TTL_SECONDS
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.DEFAULT_TIMEOUT,
+                headers=self.DEFAULT_HEADERS
+            )
         return self._session
     
     async def close(self) -> None:
@@ -355,6 +410,55 @@ class NetworkDataFetcher(ABC):
             await self._session.close()
             self._session = None
     
+    def _is_retryable(self, exc: BaseException) -> bool:
+        """
+        Decide whether a failed request should be retried.
+        
+        Connection errors and timeouts are retried; HTTP errors only when
+        the status is rate limiting or a transient server error.
+        """
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return exc.status in self.RETRYABLE_STATUS_CODES
+        return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+    
+    def _retry_wait(self, retry_state: RetryCallState) -> float:
+        """
+        Compute the delay before the next retry attempt.
+        
+        Honors a numeric Retry-After header when the server sends one,
+        otherwise uses exponential backoff with jitter so that concurrent
+        requests hitting the same failure do not retry in lockstep.
+        Both are capped at retry_config.max_wait.
+        """
+        config = self.retry_config
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        
+        headers = getattr(exc, 'headers', None)
+        if headers:
+            try:
+                return min(config.max_wait, max(0.0, float(headers.get('Retry-After', ''))))
+            except ValueError:
+                pass
+        
+        backoff = config.min_wait * config.exponential_base ** (retry_state.attempt_number - 1)
+        return min(config.max_wait, backoff) * random.uniform(0.5, 1.5)
+    
+    async def _wait_for_request_slot(self) -> None:
+        """
+        Wait until MIN_REQUEST_INTERVAL has passed since the last request start.
+        
+        Called before every attempt, so concurrent requests and their
+        retries share one schedule instead of each keeping its own delay.
+        """
+        if self.MIN_REQUEST_INTERVAL <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._request_slot_lock:
+            wait = self._next_request_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = loop.time() + self.MIN_REQUEST_INTERVAL
+    
     async def _request(
         self,
         method: str,
@@ -376,34 +480,41 @@ class NetworkDataFetcher(ABC):
         
         @retry(
             stop=stop_after_attempt(self.retry_config.max_attempts),
-            wait=wait_exponential(
-                multiplier=self.retry_config.min_wait,
-                max=self.retry_config.max_wait
-            ),
-            retry=retry_if_exception_type((
-                aiohttp.ClientError,
-                asyncio.TimeoutError,
-            )),
+            wait=self._retry_wait,
+            retry=retry_if_exception(self._is_retryable),
             before_sleep=before_sleep_log(logger, logging.WARNING)
         )
         async def _do_request():
-            async with session.request(method, url, **kwargs) as response:
-                # Read response body before context exit
-                body = await response.read()
-                # Check for rate limiting
-                if response.status == 429:
-                    retry_after = response.headers.get('Retry-After', '60')
-                    logger.warning(f"Rate limited. Retry after {retry_after}s")
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=429,
-                        message=f"Rate limited. Retry after {retry_after}s"
-                    )
-                response.raise_for_status()
-                # Store body for later access
-                response._body = body
-                return response
+            # Held per attempt only, so backoff sleeps do not occupy a slot
+            async with self._request_semaphore:
+                await self._wait_for_request_slot()
+                async with session.request(method, url, **kwargs) as response:
+                    # Check for rate limiting
+                    if response.status == 429:
+                        retry_after = response.headers.get('Retry-After', '60')
+                        logger.warning(f"Rate limited. Retry after {retry_after}s")
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=429,
+                            message=f"Rate limited. Retry after {retry_after}s",
+                            headers=response.headers
+                        )
+                    # Fail without downloading the full body of an error
+                    # response - only a short preview goes into the message
+                    if response.status >= 400:
+                        preview = await response.content.read(self.ERROR_PREVIEW_BYTES)
+                        detail = preview.decode('utf-8', errors='replace').strip()
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"{response.reason}: {detail}" if detail else (response.reason or ""),
+                            headers=response.headers
+                        )
+                    # Read response body before context exit and store it for later access
+                    response._body = await response.read()
+                    return response
         
         return await _do_request()
     
@@ -415,17 +526,56 @@ class NetworkDataFetcher(ABC):
         """Make POST request with retry."""
         return await self._request('POST', url, **kwargs)
     
-    async def _get_json(self, url: str, **kwargs) -> Any:
+    async def _request_json(self, method: str, url: str, cache: bool = True, **kwargs) -> Any:
+        """
+        Make HTTP request and return JSON response.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            cache: Allow the opt-in response cache for this call. Pass False
+                for auth and polling requests whose responses must be fresh.
+            **kwargs: Additional arguments for aiohttp request
+            
+        Returns:
+            Parsed JSON response
+        """
+        cache_key = None
+        if cache and self._response_cache is not None:
+            cache_key = self._response_cache.make_key(method, url, **kwargs)
+            body = self._response_cache.get(cache_key)
+            if body is not None:
+                return json_loads(body)
+        
+        response = await self._request(method, url, **kwargs)
+        data = json_loads(response._body)
+        # A 200 whose body reports an API error must not be replayed
+        if cache_key is not None and not self._is_error_response(data):
+            self._response_cache.set(cache_key, response._body)
+        return data
+    
+    def _is_error_response(self, data: Any) -> bool:
+        """
+        Check whether a successful (HTTP 2xx) response body reports an error.
+        
+        Override in subclasses whose API returns errors in the body of a
+        200 response; such responses are never stored in the response cache.
+        
+        Args:
+            data: Parsed JSON response
+            
+        Returns:
+            True if the body is an API error
+        """
+        return False
+    
+    async def _get_json(self, url: str, cache: bool = True, **kwargs) -> Any:
         """Make GET request and return JSON response."""
-        response = await self._get(url, **kwargs)
-        import json
-        return json.loads(response._body)
+        return await self._request_json('GET', url, cache=cache, **kwargs)
     
-    async def _post_json(self, url: str, **kwargs) -> Any:
+    async def _post_json(self, url: str, cache: bool = True, **kwargs) -> Any:
         """Make POST request and return JSON response."""
-        response = await self._post(url, **kwargs)
-        import json
-        return json.loads(response._body)
+        return await self._request_json('POST', url, cache=cache, **kwargs)
     
     # =========================================================================
     # Accumulation Helpers
@@ -466,6 +616,38 @@ class NetworkDataFetcher(ABC):
         platform_data[plat_key]['ad_data'][ad_key]['revenue'] += revenue
         platform_data[plat_key]['ad_data'][ad_key]['impressions'] += impressions
     
+    @staticmethod
+    def _accumulate_daily(
+        daily_data: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]],
+        date_key: str,
+        platform: Platform,
+        ad_type: AdType,
+        revenue: float,
+        impressions: int
+    ) -> None:
+        """
+        Accumulate metrics into the daily breakdown structure.
+        
+        Missing date/platform/ad type levels are created on first use, so
+        each row costs a single lookup per level.
+        
+        Args:
+            daily_data: Daily breakdown {date: {platform: {ad_type: metrics}}}
+            date_key: Date string (YYYY-MM-DD)
+            platform: Platform enum
+            ad_type: AdType enum
+            revenue: Revenue to add
+            impressions: Impressions to add
+        """
+        metrics = (
+            daily_data
+            .setdefault(date_key, {})
+            .setdefault(platform.value, {})
+            .setdefault(ad_type.value, {'revenue': 0.0, 'impressions': 0})
+        )
+        metrics['revenue'] += revenue
+        metrics['impressions'] += impressions
+    
     # =========================================================================
     # Context Manager Support
     # =========================================================================
@@ -3,7 +3,6 @@ BidMachine SSP data fetcher implementation.
 Async version using aiohttp with retry support.
 API Docs: https://developers.bidmachine.io/reporting-api/retrieve-ssp-report-data
 """
-import json
 import asyncio
 import logging
 from datetime import datetime, timedelta
@@ -12,6 +11,7 @@ from typing import Dict, Any, Optional, List
 import aiohttp
 
 from .base_fetcher import NetworkDataFetcher, FetchResult
+from ..utils.json_utils import json_loads, JSONDecodeError
 from ..enums import Platform, AdType, NetworkName
 
 
@@ -24,6 +24,7 @@ class BidMachineFetcher(NetworkDataFetcher):
     # BidMachine API endpoint
     BASE_URL = "https://api-eu.bidmachine.io"
     REPORT_ENDPOINT = "/api/v1/report/ssp"
+    REPORT_URL = BASE_URL + REPORT_ENDPOINT
     
     # Rate limit: 6 requests per minute
     # Max date range: 45 days
@@ -101,7 +102,7 @@ class BidMachineFetcher(NetworkDataFetcher):
         }
         
         # Make GET request with Basic Auth (with retry for rate limiting)
-        url = f"{self.BASE_URL}{self.REPORT_ENDPOINT}"
+        url = self.REPORT_URL
         max_retries = 3
         
         auth = aiohttp.BasicAuth(self.username, self.password)
@@ -129,10 +130,12 @@ class BidMachineFetcher(NetworkDataFetcher):
                             raise Exception("BidMachine API rate limit exceeded. Please try again later.")
                     
                     if response.status != 200:
-                        text = await response.text()
-                        raise Exception(f"BidMachine API error: {response.status} - {text[:500]}")
+                        # Only read the prefix needed for the error message
+                        preview = await response.content.read(self.ERROR_PREVIEW_BYTES)
+                        text = preview.decode('utf-8', errors='replace')
+                        raise Exception(f"BidMachine API error: {response.status} - {text}")
                     
-                    response_text = await response.text()
+                    rows = await self._read_ndjson_rows(response)
                     break
                     
             except Exception as e:
@@ -142,32 +145,30 @@ class BidMachineFetcher(NetworkDataFetcher):
                     continue
                 raise
         
-        # Parse NDJSON response (newline-delimited JSON)
-        rows = self._parse_ndjson_response(response_text)
-        
         return self._parse_response(rows, start_date, end_date)
     
-    def _parse_ndjson_response(self, response_text: str) -> List[Dict[str, Any]]:
+    async def _read_ndjson_rows(self, response: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
         """
-        Parse NDJSON (newline-delimited JSON) response.
+        Parse NDJSON (newline-delimited JSON) response while streaming it.
         
         BidMachine returns each row as a separate JSON object on its own line.
+        Lines are decoded as they arrive, so the full body is never held as a
+        single string alongside its split copy.
         
         Args:
-            response_text: Raw response text from API
+            response: Open response with NDJSON body
             
         Returns:
             List of parsed JSON objects
         """
         rows = []
-        lines = response_text.strip().split('\n')
         
-        for line in lines:
+        async for line in response.content:
             line = line.strip()
             if line:
                 try:
-                    rows.append(json.loads(line))
-                except json.JSONDecodeError:
+                    rows.append(json_loads(line))
+                except (JSONDecodeError, UnicodeDecodeError):
                     # Skip invalid lines
                     continue
         
@@ -212,6 +213,9 @@ class BidMachineFetcher(NetworkDataFetcher):
             self._finalize_ecpm(result, ad_data, platform_data)
             return result
         
+        # Date used for rows without a date, formatted once
+        fallback_date_key = start_date.strftime('%Y-%m-%d')
+        
         for row in rows:
             if not isinstance(row, dict):
                 continue
@@ -224,7 +228,7 @@ class BidMachineFetcher(NetworkDataFetcher):
             # Get date from response (format: YYYY-MM-DD)
             date_key = str(row.get('date', ''))
             if not date_key:
-                date_key = start_date.strftime('%Y-%m-%d')
+                date_key = fallback_date_key
             
             # Extract metrics
             revenue = float(row.get('revenue', 0) or 0)
@@ -250,15 +254,11 @@ class BidMachineFetcher(NetworkDataFetcher):
             )
             
             # Accumulate daily breakdown
-            if date_key not in daily_data:
-                daily_data[date_key] = {}
-            if platform.value not in daily_data[date_key]:
-                daily_data[date_key][platform.value] = {}
-            if ad_type.value not in daily_data[date_key][platform.value]:
-                daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-            
-            daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-            daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
+            self._accumulate_daily(
+                daily_data, date_key,
+                platform, ad_type,
+                revenue, impressions
+            )
         
         # Build result using base class helper
         result = self._build_result(
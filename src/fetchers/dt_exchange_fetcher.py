@@ -10,6 +10,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
+import aiohttp
+
 from .base_fetcher import NetworkDataFetcher, FetchResult
 from ..enums import Platform, AdType, NetworkName
 from ..utils import TokenCache
@@ -25,6 +27,8 @@ class DTExchangeFetcher(NetworkDataFetcher):
     BASE_URL = "https://reporting.fyber.com"
     AUTH_ENDPOINT = "/auth/v1/token"
     REPORT_ENDPOINT = "/api/v1/report"
+    AUTH_URL = BASE_URL + AUTH_ENDPOINT
+    REPORT_CSV_URL = BASE_URL + REPORT_ENDPOINT + "?format=csv"
     
     # Polling configuration
     POLL_INTERVAL_SECONDS = 5  # Initial poll interval
@@ -88,7 +92,7 @@ class DTExchangeFetcher(NetworkDataFetcher):
             logger.debug("Using cached DT Exchange token")
             return cached['token']
         
-        url = f"{self.BASE_URL}{self.AUTH_ENDPOINT}"
+        url = self.AUTH_URL
         
         payload = {
             "grant_type": "client_credentials",
@@ -97,7 +101,7 @@ class DTExchangeFetcher(NetworkDataFetcher):
         }
         
         try:
-            data = await self._post_json(url, json=payload)
+            data = await self._post_json(url, json=payload, cache=False)
         except Exception as e:
             error_str = str(e)
             if '400' in error_str:
@@ -147,7 +151,7 @@ class DTExchangeFetcher(NetworkDataFetcher):
         """
         token = await self._get_access_token()
         
-        url = f"{self.BASE_URL}{self.REPORT_ENDPOINT}?format=csv"
+        url = self.REPORT_CSV_URL
         
         headers = {
             "Authorization": f"Bearer {token}",
@@ -185,7 +189,7 @@ class DTExchangeFetcher(NetworkDataFetcher):
                 })
         
         try:
-            data = await self._post_json(url, headers=headers, json=payload)
+            data = await self._post_json(url, headers=headers, json=payload, cache=False)
         except Exception as e:
             error_str = str(e)
             if '401' in error_str:
@@ -193,7 +197,7 @@ class DTExchangeFetcher(NetworkDataFetcher):
                 self._token_cache.delete_token(self.TOKEN_CACHE_KEY)
                 token = await self._get_access_token()
                 headers['Authorization'] = f'Bearer {token}'
-                data = await self._post_json(url, headers=headers, json=payload)
+                data = await self._post_json(url, headers=headers, json=payload, cache=False)
             else:
                 raise Exception(f"DT Exchange report error: {error_str}")
         
@@ -213,8 +217,6 @@ class DTExchangeFetcher(NetworkDataFetcher):
         Returns:
             CSV content as string
         """
-        import aiohttp
-        
         start_time = asyncio.get_event_loop().time()
         poll_interval = self.POLL_INTERVAL_SECONDS
         
@@ -334,15 +336,11 @@ class DTExchangeFetcher(NetworkDataFetcher):
             )
             
             # Accumulate daily breakdown
-            if date_key not in daily_data:
-                daily_data[date_key] = {}
-            if platform.value not in daily_data[date_key]:
-                daily_data[date_key][platform.value] = {}
-            if ad_type.value not in daily_data[date_key][platform.value]:
-                daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-            
-            daily_data[date_key][platform.value][ad_type.value]['revenue'] += rev
-            daily_data[date_key][platform.value][ad_type.value]['impressions'] += imps
+            self._accumulate_daily(
+                daily_data, date_key,
+                platform, ad_type,
+                rev, imps
+            )
         
         return total_revenue, total_impressions
     
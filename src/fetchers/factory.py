@@ -169,7 +169,7 @@ class FetcherFactory:
             return None
         
         if not config.get(required_key):
-            logger.debug(f"{network_key} missing required key: {required_key}")
+            logger.debug("%s missing required key: %s", network_key, required_key)
             return None
         
         try:
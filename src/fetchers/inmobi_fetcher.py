@@ -9,7 +9,7 @@ from typing import Dict, Any, Optional
 
 from .base_fetcher import NetworkDataFetcher, FetchResult
 from ..enums import Platform, AdType, NetworkName
-from ..utils import TokenCache
+from ..utils import TokenCache, redact
 
 
 logger = logging.getLogger(__name__)
@@ -67,6 +67,10 @@ class InMobiFetcher(NetworkDataFetcher):
         self._token_cache = TokenCache()
         self._session_id = None
     
+    def _is_error_response(self, data: Any) -> bool:
+        """InMobi flags errors with "error": true in a 200 response."""
+        return isinstance(data, dict) and bool(data.get("error"))
+    
     async def _generate_session(self) -> str:
         """
         Generate a session ID for API authentication.
@@ -89,11 +93,11 @@ class InMobiFetcher(NetworkDataFetcher):
             "secretKey": self.secret_key
         }
         
-        logger.debug(f"Generating InMobi session for user: {self.username}")
+        logger.debug("Generating InMobi session for user: %s", self.username)
         
         try:
             # GET request with credentials in headers
-            data = await self._get_json(self.SESSION_URL, headers=headers)
+            data = await self._get_json(self.SESSION_URL, headers=headers, cache=False)
             
             # Check for error in response
             if data.get("error"):
@@ -119,7 +123,7 @@ class InMobiFetcher(NetworkDataFetcher):
                 expires_in=self.TOKEN_EXPIRES_IN
             )
             
-            logger.debug(f"InMobi session generated: {session_id[:20]}...")
+            logger.debug("InMobi session generated: %s", redact(session_id))
             return session_id
             
         except Exception as e:
@@ -186,13 +190,13 @@ class InMobiFetcher(NetworkDataFetcher):
                         "filterValue": self.app_ids
                     }
                 ]
-                logger.debug(f"Filtering by InMobi App IDs: {self.app_ids}")
+                logger.debug("Filtering by InMobi App IDs: %s", self.app_ids)
             
             body = {
                 "reportRequest": report_request
             }
             
-            logger.debug(f"Requesting InMobi data for {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+            logger.debug("Requesting InMobi data for %s to %s", start_date.date(), end_date.date())
             
             data = await self._post_json(self.REPORTING_URL, headers=headers, json=body)
             
@@ -205,7 +209,10 @@ class InMobiFetcher(NetworkDataFetcher):
             # Parse response - InMobi returns data in respList
             rows = data.get("respList", [])
             
-            logger.debug(f"Received {len(rows)} data rows from InMobi")
+            logger.debug("Received %d data rows from InMobi", len(rows))
+            
+            # Date used for rows without a date, formatted once
+            fallback_date_key = start_date.strftime('%Y-%m-%d')
             
             for row in rows:
                 revenue = float(row.get("earnings", 0) or 0)
@@ -216,7 +223,7 @@ class InMobiFetcher(NetworkDataFetcher):
                 # Get date from response (format might be: YYYY-MM-DD HH:MM:SS or YYYY-MM-DD)
                 date_key = row.get("date", "")
                 if not date_key:
-                    date_key = start_date.strftime('%Y-%m-%d')
+                    date_key = fallback_date_key
                 else:
                     # Normalize date to YYYY-MM-DD format (strip time if present)
                     date_key = str(date_key).split(' ')[0]
@@ -237,15 +244,11 @@ class InMobiFetcher(NetworkDataFetcher):
                 )
                 
                 # Accumulate daily breakdown
-                if date_key not in daily_data:
-                    daily_data[date_key] = {}
-                if platform.value not in daily_data[date_key]:
-                    daily_data[date_key][platform.value] = {}
-                if ad_type.value not in daily_data[date_key][platform.value]:
-                    daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-                
-                daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-                daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
+                self._accumulate_daily(
+                    daily_data, date_key,
+                    platform, ad_type,
+                    revenue, impressions
+                )
             
             # Build result using base class helper
             result = self._build_result(
@@ -4,6 +4,7 @@ Async version using aiohttp with retry support.
 Uses IronSource Reporting API V5 for fetching monetization data.
 API Docs: https://developers.is.com/ironsource-mobile/air/monetization-reporting-api
 """
+import asyncio
 import base64
 import logging
 from datetime import datetime
@@ -22,6 +23,7 @@ class IronSourceFetcher(NetworkDataFetcher):
     # IronSource API endpoints
     BASE_URL = "https://platform.ironsrc.com"
     REPORT_ENDPOINT = "/partners/publisher/mediation/applications/v5/stats"
+    REPORT_URL = BASE_URL + REPORT_ENDPOINT
     
     # Ad type mapping - IronSource adUnits to AdType enum
     AD_TYPE_MAP = {
@@ -89,6 +91,10 @@ class IronSourceFetcher(NetworkDataFetcher):
                 base[platform]['ad_data'][ad_type]['clicks'] = 0
         return base
     
+    def _is_error_response(self, data: Any) -> bool:
+        """IronSource returns an error object instead of the report list."""
+        return isinstance(data, dict) and ('error' in data or 'message' in data)
+    
     async def _fetch_platform_data(
         self,
         start_date: str,
@@ -141,7 +147,7 @@ class IronSourceFetcher(NetworkDataFetcher):
             'breakdown': 'adUnits,date',
         }
         
-        url = f"{self.BASE_URL}{self.REPORT_ENDPOINT}"
+        url = self.REPORT_URL
         
         try:
             data = await self._get_json(url, headers=headers, params=params)
@@ -159,6 +165,9 @@ class IronSourceFetcher(NetworkDataFetcher):
                 raise Exception(f"IronSource API error: {data}")
             return platform_data
         
+        # Date used for rows without a date, formatted once
+        fallback_date_key = start_date if isinstance(start_date, str) else start_date.strftime('%Y-%m-%d')
+        
         for item in data:
             if not isinstance(item, dict):
                 continue
@@ -178,7 +187,7 @@ class IronSourceFetcher(NetworkDataFetcher):
                 # Normalize date to YYYY-MM-DD format (strip time if present)
                 item_date = str(item_date).split(' ')[0]
             else:
-                item_date = start_date if isinstance(start_date, str) else start_date.strftime('%Y-%m-%d')
+                item_date = fallback_date_key
             
             metrics_list = item.get('data', [])
             
@@ -208,15 +217,11 @@ class IronSourceFetcher(NetworkDataFetcher):
                 
                 # Accumulate daily breakdown if daily_data is provided
                 if daily_data is not None:
-                    if item_date not in daily_data:
-                        daily_data[item_date] = {}
-                    if platform.value not in daily_data[item_date]:
-                        daily_data[item_date][platform.value] = {}
-                    if ad_key not in daily_data[item_date][platform.value]:
-                        daily_data[item_date][platform.value][ad_key] = {'revenue': 0.0, 'impressions': 0}
-                    
-                    daily_data[item_date][platform.value][ad_key]['revenue'] += rev
-                    daily_data[item_date][platform.value][ad_key]['impressions'] += imps
+                    self._accumulate_daily(
+                        daily_data, item_date,
+                        platform, ad_type,
+                        rev, imps
+                    )
         
         # Calculate eCPMs
         platform_data['ecpm'] = self._calculate_ecpm(platform_data['revenue'], platform_data['impressions'])
@@ -253,31 +258,29 @@ class IronSourceFetcher(NetworkDataFetcher):
         total_requests = 0
         total_fills = 0
         
-        # Fetch data for Android apps
-        if self.android_app_keys:
-            android_data = await self._fetch_platform_data(
-                start_str, end_str, self.android_app_keys, Platform.ANDROID, daily_data
+        # Fetch Android and iOS apps concurrently - the two requests are
+        # independent, so total latency is bounded by the slower platform
+        platform_keys = [
+            (platform, app_keys)
+            for platform, app_keys in (
+                (Platform.ANDROID, self.android_app_keys),
+                (Platform.IOS, self.ios_app_keys),
             )
-            platform_data[Platform.ANDROID.value] = android_data
-            
-            total_revenue += android_data['revenue']
-            total_impressions += android_data['impressions']
-            total_clicks += android_data['clicks']
-            total_requests += android_data['requests']
-            total_fills += android_data['fills']
+            if app_keys
+        ]
+        results = await asyncio.gather(*(
+            self._fetch_platform_data(start_str, end_str, app_keys, platform, daily_data)
+            for platform, app_keys in platform_keys
+        ))
         
-        # Fetch data for iOS apps
-        if self.ios_app_keys:
-            ios_data = await self._fetch_platform_data(
-                start_str, end_str, self.ios_app_keys, Platform.IOS, daily_data
-            )
-            platform_data[Platform.IOS.value] = ios_data
+        for (platform, _), plat_data in zip(platform_keys, results):
+            platform_data[platform.value] = plat_data
             
-            total_revenue += ios_data['revenue']
-            total_impressions += ios_data['impressions']
-            total_clicks += ios_data['clicks']
-            total_requests += ios_data['requests']
-            total_fills += ios_data['fills']
+            total_revenue += plat_data['revenue']
+            total_impressions += plat_data['impressions']
+            total_clicks += plat_data['clicks']
+            total_requests += plat_data['requests']
+            total_fills += plat_data['fills']
         
         # Build result
         result = self._build_result(
@@ -20,6 +20,7 @@ class LiftoffFetcher(NetworkDataFetcher):
     # Liftoff API endpoints
     BASE_URL = "https://report.api.vungle.com"
     REPORT_ENDPOINT = "/ext/pub/reports/performance"
+    REPORT_URL = BASE_URL + REPORT_ENDPOINT
     
     # Platform mapping - Vungle returns "iOS"/"Android"
     PLATFORM_MAP = {
@@ -50,6 +51,9 @@ class LiftoffFetcher(NetworkDataFetcher):
         super().__init__()
         self.api_key = api_key
         self.application_ids = application_ids
+        # Set once the API rejects api_key; later calls on this instance fail
+        # fast instead of repeating a request that cannot succeed
+        self._auth_error: Optional[str] = None
     
     def _get_auth_headers(self) -> Dict[str, str]:
         """
@@ -64,6 +68,10 @@ class LiftoffFetcher(NetworkDataFetcher):
             'Accept': 'application/json',
         }
     
+    def _is_error_response(self, data: Any) -> bool:
+        """Liftoff returns an error object instead of the report list."""
+        return isinstance(data, dict) and ('error' in data or 'message' in data)
+    
     async def _fetch_report_data(
         self,
         start_date: str,
@@ -79,6 +87,9 @@ class LiftoffFetcher(NetworkDataFetcher):
         Returns:
             List of report data rows
         """
+        if self._auth_error:
+            raise Exception(self._auth_error)
+        
         headers = self._get_auth_headers()
         
         # Build query parameters
@@ -98,18 +109,19 @@ class LiftoffFetcher(NetworkDataFetcher):
         if self.application_ids:
             params['applicationId'] = self.application_ids
         
-        url = f"{self.BASE_URL}{self.REPORT_ENDPOINT}"
+        url = self.REPORT_URL
         
         try:
             data = await self._get_json(url, headers=headers, params=params)
         except Exception as e:
             error_str = str(e)
             if '401' in error_str:
-                raise Exception(
-                    f"Liftoff authentication failed (401). "
+                self._auth_error = (
+                    "Liftoff authentication failed (401). "
                     "Please check your api_key in config.yaml. "
                     "Get your API key from Liftoff Dashboard → Reports page."
                 )
+                raise Exception(self._auth_error)
             raise Exception(f"Liftoff API error: {error_str}")
         
         # Parse response
@@ -193,15 +205,11 @@ class LiftoffFetcher(NetworkDataFetcher):
             )
             
             # Accumulate daily breakdown
-            if date_key not in daily_data:
-                daily_data[date_key] = {}
-            if platform.value not in daily_data[date_key]:
-                daily_data[date_key][platform.value] = {}
-            if ad_type.value not in daily_data[date_key][platform.value]:
-                daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-            
-            daily_data[date_key][platform.value][ad_type.value]['revenue'] += rev
-            daily_data[date_key][platform.value][ad_type.value]['impressions'] += imps
+            self._accumulate_daily(
+                daily_data, date_key,
+                platform, ad_type,
+                rev, imps
+            )
         
         return total_revenue, total_impressions
     
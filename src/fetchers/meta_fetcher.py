@@ -7,7 +7,7 @@ import json
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 
 from .base_fetcher import NetworkDataFetcher, FetchResult
 from ..enums import Platform, AdType, NetworkName
@@ -27,6 +27,12 @@ class MetaFetcher(NetworkDataFetcher):
     # Note: Data may still be finalizing but is usually accurate enough
     DATA_DELAY_DAYS = 1
     
+    # adnetworkanalytics accepts at most 8 days per query; longer ranges
+    # are split into windows (previously they were truncated to the last
+    # 8 days), with at most MAX_CONCURRENT_QUERIES created at once
+    MAX_QUERY_DAYS = 8
+    MAX_CONCURRENT_QUERIES = 2
+    
     # Ad format mapping - Meta placement to AdType enum
     AD_FORMAT_MAP = {
         'banner': AdType.BANNER,
@@ -62,6 +68,11 @@ class MetaFetcher(NetworkDataFetcher):
         self.access_token = access_token
         self.business_id = business_id
         self.base_url = f"https://graph.facebook.com/{self.API_VERSION}"
+        
+        # Endpoint URLs are fixed per fetcher, build them once
+        self.me_url = f"{self.base_url}/me"
+        self.query_url = f"{self.base_url}/{business_id}/adnetworkanalytics"
+        self.results_url = f"{self.base_url}/{business_id}/adnetworkanalytics_results"
     
     def _normalize_ad_format(self, placement: str) -> AdType:
         """Normalize ad format from placement name to AdType enum."""
@@ -86,50 +97,154 @@ class MetaFetcher(NetworkDataFetcher):
         
         return AdType.INTERSTITIAL
     
-    async def _poll_async_results(self, query_id: str, max_attempts: int = 10) -> list:
+    async def _test_auth(self) -> bool:
         """
-        Poll for async query results using adnetworkanalytics_results endpoint.
+        Verify the access token with a lightweight Graph API call.
+        
+        Runs on the fetcher's own aiohttp session, so a following
+        fetch_data() reuses the same connection to graph.facebook.com.
+        
+        Returns:
+            True if the token is valid, False otherwise
+        """
+        try:
+            data = await self._get_json(
+                self.me_url,
+                params={"access_token": self.access_token, "fields": "id,name"},
+                cache=False
+            )
+        except Exception as e:
+            logger.error("Meta token check failed: %s", e)
+            return False
+        
+        logger.info("Meta token valid for: %s (%s)", data.get('name', 'unknown'), data.get('id', 'unknown'))
+        return True
+    
+    def _split_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Split a date range into windows of at most MAX_QUERY_DAYS days.
         
         Args:
-            query_id: The async query ID
-            max_attempts: Maximum polling attempts
+            start_date: Range start
+            end_date: Range end (inclusive)
             
         Returns:
-            List of result data
+            List of (window_start, window_end) tuples
+        """
+        num_days = (end_date - start_date).days + 1
+        window_span = timedelta(days=self.MAX_QUERY_DAYS - 1)
+        return [
+            (window_start, min(window_start + window_span, end_date))
+            for window_start in (
+                start_date + timedelta(days=offset)
+                for offset in range(0, num_days, self.MAX_QUERY_DAYS)
+            )
+        ]
+    
+    async def _create_query(self, since: datetime, until: datetime) -> dict:
+        """
+        Create an adnetworkanalytics query for one date window.
+        
+        Args:
+            since: Window start date
+            until: Window end date
+            
+        Returns:
+            Query response (either direct data or an async query reference)
+        """
+        query_params = {
+            "access_token": self.access_token,
+            "since": since.strftime("%Y-%m-%d"),
+            "until": until.strftime("%Y-%m-%d"),
+            "metrics": '["fb_ad_network_revenue","fb_ad_network_imp","fb_ad_network_cpm"]',
+            "breakdowns": '["platform","display_format"]',
+            "aggregation_period": "day",
+        }
+        return await self._get_json(self.query_url, params=query_params)
+    
+    async def _get_query_statuses(self, query_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch status items for the given async queries in one request.
+        
+        Args:
+            query_ids: The async query IDs
+            
+        Returns:
+            Status items; for a single query, items without a query_id are
+            attributed to it
         """
-        # Use adnetworkanalytics_results endpoint
-        results_url = f"{self.base_url}/{self.business_id}/adnetworkanalytics_results"
         params = {
             "access_token": self.access_token,
-            "query_ids": json.dumps([query_id])
+            "query_ids": json.dumps(query_ids)
         }
+        data = await self._get_json(self.results_url, params=params, cache=False)
+        items = data.get('data', [])
+        if len(query_ids) == 1:
+            for item in items:
+                if not item.get('query_id'):
+                    item['query_id'] = query_ids[0]
+        return items
+    
+    async def _poll_async_results(self, query_ids: List[str], max_attempts: int = 10) -> Dict[str, list]:
+        """
+        Poll for async query results using adnetworkanalytics_results endpoint.
+        
+        All pending query IDs are checked in a single request per attempt
+        (the endpoint accepts a list of query_ids). If a batched response
+        has status items without a query_id, they cannot be matched to a
+        query, so polling falls back to one request per query.
+        
+        Args:
+            query_ids: The async query IDs
+            max_attempts: Maximum polling attempts
+            
+        Returns:
+            Dictionary mapping query ID to its result data
+        """
+        pending = list(query_ids)
+        completed: Dict[str, list] = {}
+        batched = True
         
         for attempt in range(max_attempts):
-            logger.debug(f"Meta polling attempt {attempt + 1}/{max_attempts}...")
+            logger.debug("Meta polling attempt %d/%d (%d pending)...", attempt + 1, max_attempts, len(pending))
             
             try:
-                data = await self._get_json(results_url, params=params)
+                results_data = []
+                if batched:
+                    results_data = await self._get_query_statuses(pending)
+                    if any(not item.get('query_id') for item in results_data):
+                        logger.warning("Meta results response is missing query_id, polling queries one at a time")
+                        batched = False
+                if not batched:
+                    results_data = []
+                    for query_id in list(pending):
+                        results_data.extend(await self._get_query_statuses([query_id]))
                 
-                results_data = data.get('data', [])
+                # Check which queries are complete
+                for item in results_data:
+                    status = item.get('status', '')
+                    query_id = item.get('query_id')
+                    logger.debug("Meta query %s status: %s", query_id, status)
+                    
+                    if status == 'complete' and query_id in pending:
+                        results = item.get('results', [])
+                        logger.debug("Meta results count: %d", len(results) if results else 0)
+                        completed[query_id] = results
+                        pending.remove(query_id)
+                    elif status in ['failed', 'error']:
+                        raise Exception(f"Meta query failed: {item}")
                 
-                if results_data:
-                    # Check if query is complete
-                    for item in results_data:
-                        status = item.get('status', '')
-                        logger.debug(f"Meta query status: {status}")
-                        
-                        if status == 'complete':
-                            # Return the results
-                            results = item.get('results', [])
-                            logger.debug(f"Meta results count: {len(results) if results else 0}")
-                            return results
-                        elif status in ['failed', 'error']:
-                            raise Exception(f"Meta query failed: {item}")
+                if not pending:
+                    return completed
                 
             except Exception as e:
                 if 'query failed' in str(e).lower():
                     raise
-                logger.debug(f"Meta poll error: {e}")
+                logger.debug("Meta poll error: %s", e)
             
             # Wait before next poll
             await asyncio.sleep(2)
@@ -193,13 +308,11 @@ class MetaFetcher(NetworkDataFetcher):
                 
                 # Accumulate daily breakdown
                 if daily_data is not None:
-                    if date_key not in daily_data:
-                        daily_data[date_key] = {}
-                    if plat_key not in daily_data[date_key]:
-                        daily_data[date_key][plat_key] = {}
-                    if ad_key not in daily_data[date_key][plat_key]:
-                        daily_data[date_key][plat_key][ad_key] = {'revenue': 0.0, 'impressions': 0}
-                    daily_data[date_key][plat_key][ad_key]['revenue'] += value
+                    self._accumulate_daily(
+                        daily_data, date_key,
+                        platform, ad_format,
+                        value, 0
+                    )
                     
             elif metric == 'fb_ad_network_imp':
                 int_value = int(value)
@@ -210,17 +323,60 @@ class MetaFetcher(NetworkDataFetcher):
                 
                 # Accumulate daily breakdown
                 if daily_data is not None:
-                    if date_key not in daily_data:
-                        daily_data[date_key] = {}
-                    if plat_key not in daily_data[date_key]:
-                        daily_data[date_key][plat_key] = {}
-                    if ad_key not in daily_data[date_key][plat_key]:
-                        daily_data[date_key][plat_key][ad_key] = {'revenue': 0.0, 'impressions': 0}
-                    daily_data[date_key][plat_key][ad_key]['impressions'] += int_value
+                    self._accumulate_daily(
+                        daily_data, date_key,
+                        platform, ad_format,
+                        0, int_value
+                    )
             # Skip cpm - we calculate it ourselves
             
         except (TypeError, ValueError, KeyError) as e:
-            logger.debug(f"Meta row process error: {str(e)}")
+            logger.debug("Meta row process error: %s", e)
+        
+        return revenue_added, impressions_added
+    
+    def _process_window_data(
+        self,
+        data: Any,
+        ad_data: dict,
+        platform_data: dict,
+        daily_data: dict
+    ) -> tuple:
+        """
+        Aggregate the result entries of one query window.
+        
+        Args:
+            data: Window data from a direct or polled query response
+            ad_data: Ad type aggregated data
+            platform_data: Platform aggregated data
+            daily_data: Daily breakdown data
+            
+        Returns:
+            Tuple of (revenue_added, impressions_added)
+        """
+        # Parse response data
+        if not data:
+            logger.debug("Meta returned no data.")
+        else:
+            logger.debug("Meta got %d data entries", len(data))
+        
+        revenue_added = 0.0
+        impressions_added = 0
+        
+        # Process results
+        results = data if isinstance(data, list) else [data] if data else []
+        
+        for entry in results:
+            try:
+                # Handle nested results structure from query response
+                if 'results' in entry:
+                    for row in entry.get('results', []):
+                        rev, imps = self._process_metric_row(row, ad_data, platform_data, daily_data)
+                        revenue_added += rev
+                        impressions_added += imps
+            except (TypeError, ValueError, KeyError) as e:
+                logger.debug("Meta entry parse error: %s", e)
+                continue
         
         return revenue_added, impressions_added
     
@@ -228,6 +384,9 @@ class MetaFetcher(NetworkDataFetcher):
         """
         Fetch data from Meta Audience Network Reporting API v2.
         
+        Ranges longer than MAX_QUERY_DAYS are fetched in full as several
+        query windows, at most MAX_CONCURRENT_QUERIES created at a time.
+        
         Args:
             start_date: Start date for data fetch
             end_date: End date for data fetch
@@ -237,13 +396,21 @@ class MetaFetcher(NetworkDataFetcher):
         """
         logger.debug("Fetching Meta Audience Network data (T-3 daily mode)...")
         
-        # Ensure we don't exceed Meta's 8-day limit
+        # Split into windows that respect Meta's per-query day limit
+        windows = self._split_date_range(start_date, end_date)
         range_days = (end_date - start_date).days + 1
-        if range_days > 8:
-            start_date = end_date - timedelta(days=7)  # 8 days total
-            range_days = 8
         
-        logger.debug(f"Meta date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ({range_days} days)")
+        logger.debug("Meta date range: %s to %s (%d days, %d queries)", start_date.date(), end_date.date(), range_days, len(windows))
+        if len(windows) > 1:
+            logger.info(
+                "Meta range of %d days exceeds the %d-day query limit, splitting into %d queries",
+                range_days, self.MAX_QUERY_DAYS, len(windows)
+            )
+        query_slots = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+        
+        async def create_window_query(window_start: datetime, window_end: datetime) -> dict:
+            async with query_slots:
+                return await self._create_query(window_start, window_end)
         
         # Initialize data structures using base class helpers
         ad_data = self._init_ad_data()
@@ -255,57 +422,45 @@ class MetaFetcher(NetworkDataFetcher):
         total_revenue = 0.0
         total_impressions = 0
         
-        # GET /{business_id}/adnetworkanalytics
-        query_url = f"{self.base_url}/{self.business_id}/adnetworkanalytics"
-        
-        # Query parameters
-        query_params = {
-            "access_token": self.access_token,
-            "since": start_date.strftime("%Y-%m-%d"),
-            "until": end_date.strftime("%Y-%m-%d"),
-            "metrics": '["fb_ad_network_revenue","fb_ad_network_imp","fb_ad_network_cpm"]',
-            "breakdowns": '["platform","display_format"]',
-            "aggregation_period": "day",
-        }
-        
         try:
-            query_response = await self._get_json(query_url, params=query_params)
-            
-            # Check for async query - need to poll for results
-            query_id = query_response.get('query_id')
-            async_result_link = query_response.get('async_result_link')
+            # Create window queries concurrently (bounded by query_slots) and
+            # aggregate each window's direct data as soon as its response
+            # arrives, so payloads are not held until every window returns
+            pending_query_ids = []
+            for next_response in asyncio.as_completed([
+                create_window_query(window_start, window_end)
+                for window_start, window_end in windows
+            ]):
+                query_response = await next_response
+                
+                # Check for async query - need to poll for results
+                query_id = query_response.get('query_id')
+                async_result_link = query_response.get('async_result_link')
+                
+                if query_id and async_result_link:
+                    logger.debug("Meta async query created, ID: %s", query_id)
+                    pending_query_ids.append(query_id)
+                else:
+                    # Direct data in response
+                    rev, imps = self._process_window_data(
+                        query_response.get('data', []), ad_data, platform_data, daily_data
+                    )
+                    total_revenue += rev
+                    total_impressions += imps
             
-            if query_id and async_result_link:
-                logger.debug(f"Meta async query created, ID: {query_id}")
-                data = await self._poll_async_results(query_id)
-            else:
-                # Direct data in response
-                data = query_response.get('data', [])
+            # Poll every async query together in one request per attempt
+            if pending_query_ids:
+                polled = await self._poll_async_results(pending_query_ids)
+                for query_id in pending_query_ids:
+                    rev, imps = self._process_window_data(
+                        polled.pop(query_id), ad_data, platform_data, daily_data
+                    )
+                    total_revenue += rev
+                    total_impressions += imps
             
         except Exception as e:
             raise Exception(f"Failed to fetch data from Meta Audience Network: {str(e)}")
         
-        # Parse response data
-        if not data:
-            logger.debug("Meta returned no data.")
-        else:
-            logger.debug(f"Meta got {len(data)} data entries")
-        
-        # Process results
-        results = data if isinstance(data, list) else [data] if data else []
-        
-        for entry in results:
-            try:
-                # Handle nested results structure from query response
-                if 'results' in entry:
-                    for row in entry.get('results', []):
-                        rev, imps = self._process_metric_row(row, ad_data, platform_data, daily_data)
-                        total_revenue += rev
-                        total_impressions += imps
-            except (TypeError, ValueError, KeyError) as e:
-                logger.debug(f"Meta entry parse error: {str(e)}")
-                continue
-        
         # Determine actual date range from daily_data
         # Meta API may not return all requested dates
         actual_start = start_date
@@ -313,9 +468,9 @@ class MetaFetcher(NetworkDataFetcher):
         if daily_data:
             dates_with_data = sorted(daily_data.keys())
             if dates_with_data:
-                actual_start = datetime.strptime(dates_with_data[0], '%Y-%m-%d')
-                actual_end = datetime.strptime(dates_with_data[-1], '%Y-%m-%d')
-                logger.debug(f"Meta actual data range: {dates_with_data[0]} to {dates_with_data[-1]}")
+                actual_start = datetime.fromisoformat(dates_with_data[0])
+                actual_end = datetime.fromisoformat(dates_with_data[-1])
+                logger.debug("Meta actual data range: %s to %s", dates_with_data[0], dates_with_data[-1])
         
         # Build result using base class helper with ACTUAL date range
         result = self._build_result(
@@ -332,7 +487,7 @@ class MetaFetcher(NetworkDataFetcher):
         # Finalize eCPM calculations
         self._finalize_ecpm(result, ad_data, platform_data)
         
-        logger.debug(f"Meta Total: ${result['revenue']:.2f} revenue, {result['impressions']:,} impressions")
+        logger.debug("Meta Total: $%.2f revenue, %d impressions", result['revenue'], result['impressions'])
         
         return result
     
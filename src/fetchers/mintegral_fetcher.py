@@ -2,6 +2,7 @@
 Mintegral data fetcher implementation.
 Async version using aiohttp with retry support.
 """
+import asyncio
 import hashlib
 import time
 import logging
@@ -54,20 +55,34 @@ class MintegralFetcher(NetworkDataFetcher):
         time_md5 = hashlib.md5(str(timestamp).encode()).hexdigest()
         return hashlib.md5((self.secret + time_md5).encode()).hexdigest()
     
+    def _build_signed_params(self) -> Dict[str, Any]:
+        """
+        Build the authentication params shared by all requests of a fetch.
+        
+        The timestamp and MD5 signature are computed once so that the
+        per-ad_format requests reuse them instead of re-hashing.
+        """
+        timestamp = int(time.time())
+        return {
+            "skey": self.skey,
+            "sign": self._generate_sign(timestamp),
+            "time": timestamp,
+        }
+    
+    def _is_error_response(self, data: Any) -> bool:
+        """Mintegral reports errors in the code field of a 200 response."""
+        return not isinstance(data, dict) or str(data.get('code', '')).lower() != 'ok'
+    
     async def _make_request(
         self,
+        base_params: Dict[str, Any],
         start_date: datetime,
         end_date: datetime,
         ad_format: Optional[str] = None
     ) -> Dict:
         """Make a single request to Mintegral API."""
-        timestamp = int(time.time())
-        sign = self._generate_sign(timestamp)
-        
         params = {
-            "skey": self.skey,
-            "sign": sign,
-            "time": timestamp,
+            **base_params,
             "start": start_date.strftime("%Y%m%d"),
             "end": end_date.strftime("%Y%m%d"),
             "group_by": "date,platform",
@@ -99,13 +114,26 @@ class MintegralFetcher(NetworkDataFetcher):
         total_impressions = 0
         
         try:
-            # Make separate request for each ad_format
-            for mintegral_format, ad_type in self.AD_TYPE_MAP.items():
+            # Make separate request for each ad_format - the requests are
+            # independent, so issue them concurrently
+            base_params = self._build_signed_params()
+            # Date used for rows without a date, formatted once
+            fallback_date_key = start_date.strftime('%Y-%m-%d')
+            formats = list(self.AD_TYPE_MAP.items())
+            responses = await asyncio.gather(
+                *(self._make_request(base_params, start_date, end_date, mintegral_format)
+                  for mintegral_format, _ in formats),
+                return_exceptions=True
+            )
+            
+            # Process in AD_TYPE_MAP order to keep format -> ad type mapping
+            for (mintegral_format, ad_type), data in zip(formats, responses):
                 try:
-                    data = await self._make_request(start_date, end_date, mintegral_format)
+                    if isinstance(data, Exception):
+                        raise data
                     
                     if str(data.get('code', '')).lower() != 'ok':
-                        logger.debug(f"Mintegral {mintegral_format}: {data.get('code')}")
+                        logger.debug("Mintegral %s: %s", mintegral_format, data.get('code'))
                         continue
                     
                     rows = data.get('data', {}).get('lists', [])
@@ -120,7 +148,7 @@ class MintegralFetcher(NetworkDataFetcher):
                             # Convert YYYYMMDD to YYYY-MM-DD
                             date_key = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
                         else:
-                            date_key = start_date.strftime('%Y-%m-%d')
+                            date_key = fallback_date_key
                         
                         # Detect platform using enum
                         plat_val = str(row.get('platform', '')).lower()
@@ -138,15 +166,11 @@ class MintegralFetcher(NetworkDataFetcher):
                         )
                         
                         # Accumulate daily breakdown
-                        if date_key not in daily_data:
-                            daily_data[date_key] = {}
-                        if platform.value not in daily_data[date_key]:
-                            daily_data[date_key][platform.value] = {}
-                        if ad_type.value not in daily_data[date_key][platform.value]:
-                            daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-                        
-                        daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-                        daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
+                        self._accumulate_daily(
+                            daily_data, date_key,
+                            platform, ad_type,
+                            revenue, impressions
+                        )
                         
                 except Exception as e:
                     logger.warning(f"Mintegral {mintegral_format} error: {str(e)}")
@@ -4,6 +4,7 @@ Async version using aiohttp with token caching.
 Uses Moloco Publisher Summary API for fetching monetization data.
 API Docs: https://help.publisher.moloco.com/hc/en-us/articles/26777697929111-Get-performance-data-using-the-Publisher-Summary-API
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -23,6 +24,9 @@ class MolocoFetcher(NetworkDataFetcher):
     AUTH_URL = "https://sdkpubapi.moloco.com/api/adcloud/publisher/v1/auth/tokens"
     SUMMARY_URL = "https://sdkpubapi.moloco.com/api/adcloud/publisher/v1/sdk/summary"
     
+    # Sent on the shared keep-alive session; JSON bodies set Content-Type
+    DEFAULT_HEADERS = {'Accept': 'application/json'}
+    
     # Ad type mapping - Moloco inventory_type to AdType enum
     AD_TYPE_MAP = {
         'BANNER': AdType.BANNER,
@@ -82,12 +86,17 @@ class MolocoFetcher(NetworkDataFetcher):
         self.time_zone = time_zone
         self.ad_unit_mapping = ad_unit_mapping or {}
         self._token_cache = TokenCache()
+        # Serializes token refreshes so concurrent requests share one auth POST
+        self._token_lock = asyncio.Lock()
         
     async def _get_access_token(self) -> str:
         """
         Get access token from cache or Moloco auth endpoint.
         Token is valid for 60 minutes.
         
+        Concurrent callers wait on a lock while one of them authenticates,
+        then pick the fresh token up from the cache.
+        
         Returns:
             Access token string
         """
@@ -97,6 +106,20 @@ class MolocoFetcher(NetworkDataFetcher):
             logger.debug("Using cached Moloco token")
             return cached['token']
         
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited
+            cached = self._token_cache.get_token(self.TOKEN_CACHE_KEY)
+            if cached:
+                return cached['token']
+            return await self._request_access_token()
+    
+    async def _request_access_token(self) -> str:
+        """
+        Request a new access token from Moloco auth endpoint and cache it.
+        
+        Returns:
+            Access token string
+        """
         # Get new token via async request
         payload = {
             'email': self.email,
@@ -105,7 +128,7 @@ class MolocoFetcher(NetworkDataFetcher):
         }
         
         try:
-            data = await self._post_json(self.AUTH_URL, json=payload)
+            data = await self._post_json(self.AUTH_URL, json=payload, cache=False)
         except Exception as e:
             raise Exception(f"Moloco auth error: {str(e)}")
         
@@ -142,18 +165,17 @@ class MolocoFetcher(NetworkDataFetcher):
         """
         token = await self._get_access_token()
         
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {token}',
-        }
+        headers = {'Authorization': f'Bearer {token}'}
         
         try:
             return await self._post_json(self.SUMMARY_URL, headers=headers, json=payload)
         except Exception as e:
             if '401' in str(e):
-                # Token expired, clear cache and retry
-                self._token_cache.delete_token(self.TOKEN_CACHE_KEY)
+                # Token expired, clear cache and retry - unless a concurrent
+                # request already replaced it with a fresh one
+                cached = self._token_cache.get_token(self.TOKEN_CACHE_KEY)
+                if cached and cached['token'] == token:
+                    self._token_cache.delete_token(self.TOKEN_CACHE_KEY)
                 token = await self._get_access_token()
                 headers['Authorization'] = f'Bearer {token}'
                 return await self._post_json(self.SUMMARY_URL, headers=headers, json=payload)
@@ -228,6 +250,9 @@ class MolocoFetcher(NetworkDataFetcher):
         
         rows = response_data.get('rows', [])
         
+        # Date used for rows without a date, formatted once
+        fallback_date_key = start_date.strftime('%Y-%m-%d')
+        
         for row in rows:
             if not isinstance(row, dict):
                 continue
@@ -235,7 +260,7 @@ class MolocoFetcher(NetworkDataFetcher):
             # Get date from UTC_DATE dimension (format: "YYYY-MM-DD HH:MM:SS +0000 UTC")
             date_key = row.get('utc_date', '')
             if not date_key:
-                date_key = start_date.strftime('%Y-%m-%d')
+                date_key = fallback_date_key
             else:
                 # Normalize date to YYYY-MM-DD format (strip time and timezone)
                 date_key = str(date_key).split(' ')[0]
@@ -296,15 +321,11 @@ class MolocoFetcher(NetworkDataFetcher):
             ad_data[ad_key]['impressions'] += impressions
             
             # Accumulate daily breakdown
-            if date_key not in daily_data:
-                daily_data[date_key] = {}
-            if plat_key not in daily_data[date_key]:
-                daily_data[date_key][plat_key] = {}
-            if ad_key not in daily_data[date_key][plat_key]:
-                daily_data[date_key][plat_key][ad_key] = {'revenue': 0.0, 'impressions': 0}
-            
-            daily_data[date_key][plat_key][ad_key]['revenue'] += revenue
-            daily_data[date_key][plat_key][ad_key]['impressions'] += impressions
+            self._accumulate_daily(
+                daily_data, date_key,
+                platform, ad_type,
+                revenue, impressions
+            )
         
         # Build result using base class helper
         result = self._build_result(
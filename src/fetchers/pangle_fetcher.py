@@ -22,6 +22,7 @@ class PangleFetcher(NetworkDataFetcher):
     # Pangle API endpoints
     BASE_URL = "https://open-api.pangleglobal.com"
     REPORT_ENDPOINT = "/union_pangle/open/api/rt/income"
+    REPORT_URL = BASE_URL + REPORT_ENDPOINT
     
     # API version and sign type (required by Pangle)
     API_VERSION = "2.0"
@@ -48,8 +49,31 @@ class PangleFetcher(NetworkDataFetcher):
         'iOS': Platform.IOS,
     }
     
-    # Rate limit: 5 QPS (queries per second)
-    RATE_LIMIT_DELAY = 0.2  # 200ms delay between requests
+    # Response codes - success, success without data, and known errors
+    SUCCESS_CODE = '100'
+    NO_DATA_CODE = 'PD0004'
+    ERROR_MESSAGES = {
+        '101': (
+            "Pangle signature verification failed. "
+            "Please check your user_id, role_id, and secure_key in config.yaml"
+        ),
+        '102': (
+            "Pangle invalid user_id. "
+            "Please check your user_id in config.yaml"
+        ),
+        '103': "Pangle invalid date format: {date}",
+        '106': (
+            "Pangle QPS limit exceeded (5 queries/second). "
+            "Please wait and retry."
+        ),
+        '114': "Pangle invalid parameter: {message}",
+        '133': "Pangle invalid region: {message}",
+    }
+    UNKNOWN_ERROR_MESSAGE = "Pangle API error: Code={code}, Message={message}"
+    
+    # Rate limit: 5 QPS (queries per second) - enforced by the base
+    # fetcher's shared limiter on every request start, retries included
+    MIN_REQUEST_INTERVAL = 0.2  # 200ms between request starts
     
     def __init__(
         self,
@@ -99,6 +123,11 @@ class PangleFetcher(NetworkDataFetcher):
         sign_str = param_str + self.secure_key
         return hashlib.md5(sign_str.encode()).hexdigest()
     
+    def _is_error_response(self, data: Any) -> bool:
+        """Pangle reports errors in the Code field of a 200 response."""
+        code = str(data.get('Code', '')) if isinstance(data, dict) else ''
+        return code not in (self.SUCCESS_CODE, self.NO_DATA_CODE)
+    
     async def _fetch_single_day(self, date: datetime) -> List[Dict[str, Any]]:
         """
         Fetch data for a single day.
@@ -127,7 +156,7 @@ class PangleFetcher(NetworkDataFetcher):
         # Generate signature
         params['sign'] = self._generate_sign(params)
         
-        url = f"{self.BASE_URL}{self.REPORT_ENDPOINT}"
+        url = self.REPORT_URL
         
         try:
             data = await self._get_json(url, params=params)
@@ -138,32 +167,12 @@ class PangleFetcher(NetworkDataFetcher):
         code = str(data.get('Code', ''))
         message = data.get('Message', '')
         
-        if code == '101':
-            raise Exception(
-                "Pangle signature verification failed. "
-                "Please check your user_id, role_id, and secure_key in config.yaml"
-            )
-        elif code == '102':
-            raise Exception(
-                "Pangle invalid user_id. "
-                "Please check your user_id in config.yaml"
-            )
-        elif code == '103':
-            raise Exception(f"Pangle invalid date format: {date_str}")
-        elif code == '106':
-            raise Exception(
-                "Pangle QPS limit exceeded (5 queries/second). "
-                "Please wait and retry."
-            )
-        elif code == '114':
-            raise Exception(f"Pangle invalid parameter: {message}")
-        elif code == '133':
-            raise Exception(f"Pangle invalid region: {message}")
-        elif code == 'PD0004':
+        if code == self.NO_DATA_CODE:
             # Success but no data
             return []
-        elif code != '100':
-            raise Exception(f"Pangle API error: Code={code}, Message={message}")
+        if code != self.SUCCESS_CODE:
+            template = self.ERROR_MESSAGES.get(code, self.UNKNOWN_ERROR_MESSAGE)
+            raise Exception(template.format(code=code, message=message, date=date_str))
         
         # Extract data - response format: {"Code": "100", "Data": {"2021-01-12": [...]}}
         response_data = data.get('Data', {})
@@ -197,15 +206,24 @@ class PangleFetcher(NetworkDataFetcher):
         total_revenue = 0.0
         total_impressions = 0
         
-        # Iterate through each day in the range
-        current_date = start_date
-        while current_date <= end_date:
+        # Fetch all days concurrently; request starts are spaced by the
+        # shared rate limiter so the 5 QPS limit holds while responses
+        # overlap. The task group cancels the remaining days if one fails
+        num_days = (end_date - start_date).days + 1
+        days = [start_date + timedelta(days=i) for i in range(num_days)]
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._fetch_single_day(day)) for day in days]
+        except ExceptionGroup as eg:
+            # Surface the first failure as a plain exception, as before
+            raise eg.exceptions[0]
+        records_per_day = [task.result() for task in tasks]
+        
+        # Process days in date order
+        for current_date, records in zip(days, records_per_day):
             # Get date key for daily breakdown
             date_key = current_date.strftime('%Y-%m-%d')
             
-            # Fetch data for the current day
-            records = await self._fetch_single_day(current_date)
-            
             # Process records
             for record in records:
                 if not isinstance(record, dict):
@@ -246,21 +264,11 @@ class PangleFetcher(NetworkDataFetcher):
                 )
                 
                 # Accumulate daily breakdown
-                if date_key not in daily_data:
-                    daily_data[date_key] = {}
-                if platform.value not in daily_data[date_key]:
-                    daily_data[date_key][platform.value] = {}
-                if ad_type.value not in daily_data[date_key][platform.value]:
-                    daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-                
-                daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-                daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
-            
-            # Rate limit delay (5 QPS limit)
-            await asyncio.sleep(self.RATE_LIMIT_DELAY)
-            
-            # Move to next day
-            current_date += timedelta(days=1)
+                self._accumulate_daily(
+                    daily_data, date_key,
+                    platform, ad_type,
+                    revenue, impressions
+                )
         
         # Build result using base class helper
         result = self._build_result(
@@ -54,6 +54,7 @@ class UnityAdsFetcher(NetworkDataFetcher):
         super().__init__()
         self.api_key = api_key
         self.organization_id = organization_id
+        self.api_url = f"{self.BASE_URL}/{organization_id}"
         self.game_ids = [g.strip() for g in game_ids.split(',') if g.strip()] if game_ids else []
     
     def _extract_ad_format_from_placement(self, placement: str) -> AdType:
@@ -88,8 +89,7 @@ class UnityAdsFetcher(NetworkDataFetcher):
         Returns:
             FetchResult containing revenue, impressions, ecpm data by platform and ad type
         """
-        # Build API URL
-        api_url = f"{self.BASE_URL}/{self.organization_id}"
+        api_url = self.api_url
         
         # Headers
         headers = {"Accept": "application/json"}
@@ -107,8 +107,8 @@ class UnityAdsFetcher(NetworkDataFetcher):
         if self.game_ids:
             params["gameIds"] = ",".join(self.game_ids)
         
-        logger.debug(f"Unity Ads API URL: {api_url}")
-        logger.debug(f"Unity Ads params: {params}")
+        logger.debug("Unity Ads API URL: %s", api_url)
+        logger.debug("Unity Ads params: %s", params)
         
         try:
             data = await self._get_json(api_url, headers=headers, params=params)
@@ -130,9 +130,12 @@ class UnityAdsFetcher(NetworkDataFetcher):
         rows = data if isinstance(data, list) else data.get('results', data.get('data', data.get('rows', [])))
         
         if not rows:
-            logger.debug(f"Unity Ads returned no data. Response: {str(data)[:200]}")
+            logger.debug("Unity Ads returned no data. Response: %.200s", data)
         else:
-            logger.debug(f"Unity Ads got {len(rows)} rows")
+            logger.debug("Unity Ads got %d rows", len(rows))
+        
+        # Date used for rows without a date, formatted once
+        fallback_date_key = start_date.strftime('%Y-%m-%d')
         
         for row in rows:
             try:
@@ -147,7 +150,7 @@ class UnityAdsFetcher(NetworkDataFetcher):
                     # Handle ISO format: 2026-01-07T00:00:00.000Z
                     date_key = date_raw[:10] if len(date_raw) >= 10 else date_raw
                 else:
-                    date_key = start_date.strftime('%Y-%m-%d')
+                    date_key = fallback_date_key
                 
                 # Extract metrics
                 revenue = float(row.get('revenue_sum', row.get('revenue', 0)) or 0)
@@ -172,15 +175,11 @@ class UnityAdsFetcher(NetworkDataFetcher):
                 )
                 
                 # Accumulate daily breakdown
-                if date_key not in daily_data:
-                    daily_data[date_key] = {}
-                if platform.value not in daily_data[date_key]:
-                    daily_data[date_key][platform.value] = {}
-                if ad_type.value not in daily_data[date_key][platform.value]:
-                    daily_data[date_key][platform.value][ad_type.value] = {'revenue': 0.0, 'impressions': 0}
-                
-                daily_data[date_key][platform.value][ad_type.value]['revenue'] += revenue
-                daily_data[date_key][platform.value][ad_type.value]['impressions'] += impressions
+                self._accumulate_daily(
+                    daily_data, date_key,
+                    platform, ad_type,
+                    revenue, impressions
+                )
                 
             except (TypeError, ValueError, KeyError) as e:
                 logger.warning(f"Unity Ads row parse error: {str(e)}")
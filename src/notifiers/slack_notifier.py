@@ -2,12 +2,24 @@
 Slack notifier for sending alerts.
 """
 import requests
-import json
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timezone
 
 from src.enums import NetworkName
-from src.utils import parse_delta_percentage
+from src.utils import exceeds_threshold, get_session, json_dumps
+
+
+# Placement table layout, compiled once: one format call per row instead of
+# eleven separate f-string fields
+_PLACEMENT_HEADER = (
+    f"{'Application':<28} | {'Ad Type':<12} | {'MAX Imps':>10} | {'Net Imps':>10} | {'Imp Δ':>8} | "
+    f"{'MAX Rev':>10} | {'Net Rev':>10} | {'Rev Δ':>8} | {'MAX CPM':>9} | {'Net CPM':>9} | {'CPM Δ':>8}"
+)
+_PLACEMENT_RULE = "─" * 145
+_format_placement_row = (
+    "{:<28.28} | {:<12.12} | {:>10,} | {:>10,} | {:>+7.1f}% | "
+    "$ {:>8,.2f} | $ {:>8,.2f} | {:>+7.1f}% | $ {:>7,.2f} | $ {:>7,.2f} | {:>+7.1f}%"
+).format
 
 
 class SlackNotifier:
@@ -15,6 +27,10 @@ class SlackNotifier:
     
     # Ad type and platform order
     AD_TYPE_ORDER = ['banner', 'interstitial', 'rewarded']
+    # Slack allows 3000 characters per section text; leave some margin
+    SECTION_TEXT_LIMIT = 2800
+    # Slack rejects messages with more than 50 blocks
+    MAX_BLOCKS_PER_MESSAGE = 50
     PLATFORM_ORDER = ['android', 'ios']
     
     # Legacy icon mapping (fallback for unknown network names)
@@ -103,37 +119,23 @@ class SlackNotifier:
         if not placement_breakdown:
             return ""
         
-        lines = []
-        # Header
-        lines.append(f"{'Application':<28} | {'Ad Type':<12} | {'MAX Imps':>10} | {'Net Imps':>10} | {'Imp Δ':>8} | {'MAX Rev':>10} | {'Net Rev':>10} | {'Rev Δ':>8} | {'MAX CPM':>9} | {'Net CPM':>9} | {'CPM Δ':>8}")
-        lines.append("─" * 145)
-        
-        for p in placement_breakdown:
-            app = p.get('application', '')[:28]
-            ad_type = p.get('ad_type', '')[:12]
-            max_imps = p.get('max_impressions', 0)
-            net_imps = p.get('network_impressions', 0)
-            imp_delta = p.get('imp_delta', 0)
-            max_rev = p.get('max_revenue', 0)
-            net_rev = p.get('network_revenue', 0)
-            rev_delta = p.get('rev_delta', 0)
-            max_ecpm = p.get('max_ecpm', 0)
-            net_ecpm = p.get('network_ecpm', 0)
-            ecpm_delta = p.get('ecpm_delta', 0)
-            
-            lines.append(
-                f"{app:<28} | "
-                f"{ad_type:<12} | "
-                f"{max_imps:>10,} | "
-                f"{net_imps:>10,} | "
-                f"{imp_delta:>+7.1f}% | "
-                f"$ {max_rev:>8,.2f} | "
-                f"$ {net_rev:>8,.2f} | "
-                f"{rev_delta:>+7.1f}% | "
-                f"$ {max_ecpm:>7,.2f} | "
-                f"$ {net_ecpm:>7,.2f} | "
-                f"{ecpm_delta:>+7.1f}%"
+        lines = [_PLACEMENT_HEADER, _PLACEMENT_RULE]
+        lines.extend(
+            _format_placement_row(
+                p.get('application', ''),
+                p.get('ad_type', ''),
+                p.get('max_impressions', 0),
+                p.get('network_impressions', 0),
+                p.get('imp_delta', 0),
+                p.get('max_revenue', 0),
+                p.get('network_revenue', 0),
+                p.get('rev_delta', 0),
+                p.get('max_ecpm', 0),
+                p.get('network_ecpm', 0),
+                p.get('ecpm_delta', 0),
             )
+            for p in placement_breakdown
+        )
         
         return "\n".join(lines)
     
@@ -165,45 +167,50 @@ class SlackNotifier:
         Returns:
             True if sent successfully, False otherwise
         """
-        # Filter rows by revenue delta threshold AND minimum revenue
-        # Only check rows that have network data for comparison
+        # Single pass over the rows: threshold filter (rows with network data
+        # and revenue above the minimum), coverage sums and network sets
         total_rows = len(comparison_rows)
-        rows_with_data = [r for r in comparison_rows if r.get('has_network_data', False)]
         filtered_rows = []
+        rows_with_data_count = 0
         low_revenue_rows = 0
+        all_max_revenue = 0
+        compared_max_revenue = 0
+        networks_with_missing = set()
+        unique_networks = set()
         
-        for row in rows_with_data:
+        for row in comparison_rows:
             max_rev = row.get('max_revenue', 0)
+            all_max_revenue += max_rev
+            
+            if not row.get('has_network_data', False):
+                networks_with_missing.add(row.get('network', 'Unknown'))
+                continue
+            
+            rows_with_data_count += 1
+            compared_max_revenue += max_rev
+            network = row.get('network')
+            if network:
+                unique_networks.add(network.replace(' Bidding', ''))
             
             # Skip rows with revenue below minimum threshold
             if max_rev < min_revenue:
                 low_revenue_rows += 1
                 continue
             
-            rev_delta_value = parse_delta_percentage(row.get('rev_delta', '0%'))
-            if abs(rev_delta_value) > threshold:
+            if exceeds_threshold(row.get('rev_delta', '0%'), threshold):
                 filtered_rows.append(row)
         
         filtered_count = len(filtered_rows)
-        checked_rows = len(rows_with_data) - low_revenue_rows
+        checked_rows = rows_with_data_count - low_revenue_rows
         
         # Check for failed networks
         failed_networks = network_data.get('_failed_networks', []) if network_data else []
         
-        # Calculate coverage stats (MAX total vs compared total)
+        # Coverage stats (MAX total vs compared total)
         # MAX total = all rows, Compared total = only rows with network data
-        all_max_revenue = sum(r.get('max_revenue', 0) for r in comparison_rows)
-        compared_rows = [r for r in comparison_rows if r.get('has_network_data', False)]
-        compared_max_revenue = sum(r.get('max_revenue', 0) for r in compared_rows)
         missing_revenue = all_max_revenue - compared_max_revenue
         coverage_pct = (compared_max_revenue / all_max_revenue * 100) if all_max_revenue > 0 else 100
         
-        # Find which networks have missing data (no API data)
-        networks_with_missing = set()
-        for row in comparison_rows:
-            if not row.get('has_network_data', False):
-                networks_with_missing.add(row.get('network', 'Unknown'))
-        
         coverage_info = {
             'all_max_revenue': all_max_revenue,
             'compared_max_revenue': compared_max_revenue,
@@ -215,12 +222,8 @@ class SlackNotifier:
         blocks = []
         now_utc = datetime.now(timezone.utc)
         
-        # Get unique networks from comparison rows for header
-        unique_networks = sorted(set(
-            row.get('network', '').replace(' Bidding', '') 
-            for row in comparison_rows 
-            if row.get('has_network_data', False) and row.get('network')
-        ))
+        # Unique networks (with data) for header
+        unique_networks = sorted(unique_networks)
         
         # Check if any network exceeds threshold using network_summary
         network_summary = network_data.get('_network_summary', {}) if network_data else {}
@@ -288,8 +291,14 @@ class SlackNotifier:
         date_end = dates[-1]
         num_days = len(dates)
         
-        # Calculate aggregated totals by network
+        # Calculate aggregated totals by network; overall totals and the
+        # exceeded-row count are accumulated in the same pass
         network_totals = {}
+        overall_max_rev = 0
+        overall_net_rev = 0
+        overall_max_imps = 0
+        overall_net_imps = 0
+        total_filtered = 0
         for row in comparison_rows:
             network = row.get('network', 'Unknown')
             if network not in network_totals:
@@ -300,25 +309,30 @@ class SlackNotifier:
                     'filtered_rows': []  # Rows exceeding threshold
                 }
             
-            network_totals[network]['max_revenue'] += row.get('max_revenue', 0)
-            network_totals[network]['network_revenue'] += row.get('network_revenue', 0)
-            network_totals[network]['max_impressions'] += row.get('max_impressions', 0)
-            network_totals[network]['network_impressions'] += row.get('network_impressions', 0)
-            network_totals[network]['dates'].add(row.get('date', ''))
-            network_totals[network]['rows'].append(row)
-            
-            # Check if this row exceeds threshold
             max_rev = row.get('max_revenue', 0)
-            if max_rev >= min_revenue:
-                rev_delta_value = parse_delta_percentage(row.get('rev_delta', '0%'))
-                if abs(rev_delta_value) > threshold:
-                    network_totals[network]['filtered_rows'].append(row)
-        
-        # Calculate overall totals
-        overall_max_rev = sum(n['max_revenue'] for n in network_totals.values())
-        overall_net_rev = sum(n['network_revenue'] for n in network_totals.values())
-        overall_max_imps = sum(n['max_impressions'] for n in network_totals.values())
-        overall_net_imps = sum(n['network_impressions'] for n in network_totals.values())
+            net_rev = row.get('network_revenue', 0)
+            max_imps = row.get('max_impressions', 0)
+            net_imps = row.get('network_impressions', 0)
+            
+            totals_for_network = network_totals[network]
+            totals_for_network['max_revenue'] += max_rev
+            totals_for_network['network_revenue'] += net_rev
+            totals_for_network['max_impressions'] += max_imps
+            totals_for_network['network_impressions'] += net_imps
+            totals_for_network['dates'].add(row.get('date', ''))
+            totals_for_network['rows'].append(row)
+            
+            overall_max_rev += max_rev
+            overall_net_rev += net_rev
+            overall_max_imps += max_imps
+            overall_net_imps += net_imps
+            
+            # Check if this row exceeds threshold - cheap revenue/data checks
+            # first; rows without network data carry no delta to parse
+            if max_rev >= min_revenue and row.get('has_network_data', False):
+                if exceeds_threshold(row.get('rev_delta', '0%'), threshold):
+                    totals_for_network['filtered_rows'].append(row)
+                    total_filtered += 1
         
         overall_rev_delta = ((overall_net_rev - overall_max_rev) / overall_max_rev * 100) if overall_max_rev > 0 else 0
         overall_imp_delta = ((overall_net_imps - overall_max_imps) / overall_max_imps * 100) if overall_max_imps > 0 else 0
@@ -326,8 +340,6 @@ class SlackNotifier:
         # Check for failed networks
         failed_networks = network_data.get('_failed_networks', []) if network_data else []
         
-        # Count rows exceeding threshold
-        total_filtered = sum(len(n['filtered_rows']) for n in network_totals.values())
         total_rows = len(comparison_rows)
         
         blocks = []
@@ -402,7 +414,7 @@ class SlackNotifier:
                 icon = self.NETWORK_ICONS.get(network_name.upper().replace(' ', '_'), '📡')
             
             # Status indicator
-            status = "🔴" if abs(rev_delta) > threshold else "🟢"
+            status = "🔴" if exceeds_threshold(rev_delta, threshold) else "🟢"
             
             # Build line
             line = f"{status} {icon} *{network_name}* ({num_dates}d"
@@ -447,29 +459,34 @@ class SlackNotifier:
         aggregated = {}
         
         for row in rows:
-            key = (row.get('network', ''), row.get('application', ''), row.get('ad_type', ''))
+            network = row.get('network', '')
+            application = row.get('application', '')
+            ad_type = row.get('ad_type', '')
+            key = (network, application, ad_type)
             
-            if key not in aggregated:
-                aggregated[key] = {
-                    'network': row.get('network', ''),
-                    'application': row.get('application', ''),
-                    'ad_type': row.get('ad_type', ''),
+            agg = aggregated.get(key)
+            if agg is None:
+                agg = aggregated[key] = {
+                    'network': network,
+                    'application': application,
+                    'ad_type': ad_type,
                     'max_impressions': 0,
                     'network_impressions': 0,
                     'max_revenue': 0,
                     'network_revenue': 0,
-                    'dates': [],
+                    'dates': set(),
                     'has_network_data': False  # Track if any row has network data
                 }
             
-            aggregated[key]['max_impressions'] += row.get('max_impressions', 0) or 0
-            aggregated[key]['network_impressions'] += row.get('network_impressions', 0) or 0
-            aggregated[key]['max_revenue'] += row.get('max_revenue', 0) or 0
-            aggregated[key]['network_revenue'] += row.get('network_revenue', 0) or 0
+            agg['max_impressions'] += row.get('max_impressions', 0) or 0
+            agg['network_impressions'] += row.get('network_impressions', 0) or 0
+            agg['max_revenue'] += row.get('max_revenue', 0) or 0
+            agg['network_revenue'] += row.get('network_revenue', 0) or 0
             if row.get('has_network_data'):
-                aggregated[key]['has_network_data'] = True
-            if row.get('date'):
-                aggregated[key]['dates'].append(row.get('date'))
+                agg['has_network_data'] = True
+            row_date = row.get('date')
+            if row_date:
+                agg['dates'].add(row_date)
         
         # Calculate deltas and eCPM for aggregated rows
         result = []
@@ -501,7 +518,7 @@ class SlackNotifier:
                 'max_ecpm': max_ecpm,
                 'network_ecpm': net_ecpm,
                 'cpm_delta': cpm_delta,
-                'num_days': len(set(agg['dates']))
+                'num_days': len(agg['dates'])
             })
         
         # Sort by network, application, ad_type
@@ -530,6 +547,8 @@ class SlackNotifier:
         coverage_info = coverage_info or {}
         network_summary = network_data.get('_network_summary', {}) if network_data else {}
         end_date_summary = network_data.get('_end_date_summary', {}) if network_data else {}
+        # Local midnight for the 'days behind' labels, computed once per report
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Use warning header if there are failed networks
         if failed_networks:
@@ -610,15 +629,14 @@ class SlackNotifier:
                     icon = self.NETWORK_ICONS.get(network_key.upper(), '📡')
                 
                 # Status indicator
-                status = "✅" if abs(rev_delta) <= threshold else "⚠️"
+                status = "⚠️" if exceeds_threshold(rev_delta, threshold) else "✅"
                 
                 # Format network name for display
                 display_name = network_key.replace('_', ' ').title()
                 
                 # Calculate days behind
                 try:
-                    date_obj = datetime.strptime(last_date, '%Y-%m-%d')
-                    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                    date_obj = datetime.fromisoformat(last_date)
                     days_behind = (today - date_obj).days
                     date_label = f"T-{days_behind}" if days_behind > 0 else "Today"
                 except (ValueError, TypeError):
@@ -630,23 +648,7 @@ class SlackNotifier:
                 network_lines.append(line)
             
             # Add networks in chunks to avoid message length limits
-            # Slack has a 3000 character limit per text field
-            current_text = ""
-            for line in network_lines:
-                if len(current_text) + len(line) + 2 > 2800:  # Leave some margin
-                    blocks.append({
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": current_text}
-                    })
-                    current_text = line
-                else:
-                    current_text += "\n\n" + line if current_text else line
-            
-            if current_text:
-                blocks.append({
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": current_text}
-                })
+            blocks.extend(self._build_section_blocks(network_lines, "\n\n"))
         
         blocks.append({"type": "divider"})
         
@@ -699,6 +701,8 @@ class SlackNotifier:
         coverage_info = coverage_info or {}
         network_summary = network_data.get('_network_summary', {}) if network_data else {}
         end_date_summary = network_data.get('_end_date_summary', {}) if network_data else {}
+        # Local midnight for the 'days behind' labels, computed once per report
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Header with alert
         header_text = "⚠️ Network Comparison Report - Threshold Exceeded"
@@ -768,8 +772,7 @@ class SlackNotifier:
                 
                 # Calculate days behind
                 try:
-                    date_obj = datetime.strptime(last_date, '%Y-%m-%d')
-                    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                    date_obj = datetime.fromisoformat(last_date)
                     days_behind = (today - date_obj).days
                     date_label = f"T-{days_behind}" if days_behind > 0 else "Today"
                 except (ValueError, TypeError):
@@ -836,8 +839,7 @@ class SlackNotifier:
                 
                 # Calculate days behind
                 try:
-                    date_obj = datetime.strptime(last_date, '%Y-%m-%d')
-                    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                    date_obj = datetime.fromisoformat(last_date)
                     days_behind = (today - date_obj).days
                     date_label = f"T-{days_behind}" if days_behind > 0 else "Today"
                 except (ValueError, TypeError):
@@ -847,22 +849,7 @@ class SlackNotifier:
                 network_lines.append(line)
             
             # Add networks in chunks
-            current_text = ""
-            for line in network_lines:
-                if len(current_text) + len(line) + 2 > 2800:
-                    blocks.append({
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": current_text}
-                    })
-                    current_text = line
-                else:
-                    current_text += "\n" + line if current_text else line
-            
-            if current_text:
-                blocks.append({
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": current_text}
-                })
+            blocks.extend(self._build_section_blocks(network_lines, "\n"))
         
         blocks.append({"type": "divider"})
         
@@ -1155,11 +1142,11 @@ class SlackNotifier:
             
             # Overall metrics
             for disc in comp.get('discrepancies', []):
-                if disc.get('over_threshold'):
-                    metric = disc['metric'].upper()
-                    v1 = disc['network1_value']
-                    v2 = disc['network2_value']
-                    pct = disc['difference_percentage']
+                if disc.over_threshold:
+                    metric = disc.metric.upper()
+                    v1 = disc.network1_value
+                    v2 = disc.network2_value
+                    pct = disc.difference_percentage
                     pct_str = "∞" if pct == float('inf') else f"{pct:.1f}%"
                     
                     if metric == 'REVENUE':
@@ -1216,27 +1203,126 @@ class SlackNotifier:
             payload["channel"] = self.channel
         return payload
     
+    def _build_section_blocks(self, lines: List[str], separator: str) -> List[Dict[str, Any]]:
+        """
+        Pack text lines into as few mrkdwn section blocks as fit Slack's text limit.
+        
+        Lines are grouped first and each section's text is joined once,
+        instead of growing a string line by line.
+        
+        Args:
+            lines: Text lines to pack, in order
+            separator: Separator placed between lines of a section
+            
+        Returns:
+            List of section blocks
+        """
+        limit = self.SECTION_TEXT_LIMIT
+        sep_len = len(separator)
+        chunks = []
+        current = []
+        current_len = 0
+        for line in lines:
+            if current and current_len + len(line) + 2 > limit:
+                chunks.append(current)
+                current = []
+                current_len = 0
+            current_len += len(line) + (sep_len if current else 0)
+            current.append(line)
+        if current:
+            chunks.append(current)
+        
+        return [
+            {"type": "section", "text": {"type": "mrkdwn", "text": separator.join(chunk)}}
+            for chunk in chunks
+        ]
+    
+    def _split_blocks(self, blocks: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Split blocks into chunks that each fit in one Slack message.
+        
+        Chunks end at the last divider that fits, so a table or section
+        group is not cut in half; the divider itself is dropped since the
+        message boundary separates the chunks. A run of blocks with no
+        divider is cut at the limit. One slot per chunk is kept free for
+        the continuation note added by _send_to_slack.
+        
+        Args:
+            blocks: Message blocks, in order
+            
+        Returns:
+            List of block chunks
+        """
+        limit = self.MAX_BLOCKS_PER_MESSAGE - 1
+        chunks = []
+        rest = blocks
+        while len(rest) > limit:
+            cut = next(
+                (i for i in range(limit, 0, -1) if rest[i].get('type') == 'divider'),
+                None
+            )
+            if cut is None:
+                chunks.append(rest[:limit])
+                rest = rest[limit:]
+            else:
+                chunks.append(rest[:cut])
+                rest = rest[cut + 1:]
+        if rest:
+            chunks.append(rest)
+        return chunks
+    
     def _send_to_slack(self, payload: Dict[str, Any]) -> bool:
         """
         Send payload to Slack webhook.
         
+        Payloads with more blocks than Slack accepts in one message are
+        split at divider boundaries into consecutive messages over the
+        shared keep-alive session; each follow-up message starts with a
+        "(continued k/n)" note. If a follow-up fails after earlier parts
+        were posted, the partial send is reported separately from a
+        message that was not delivered at all.
+        
         Args:
             payload: Message payload
             
         Returns:
-            True if sent successfully, False otherwise
+            True if every part was sent successfully, False otherwise
         """
+        blocks = payload.get('blocks') or []
+        if len(blocks) <= self.MAX_BLOCKS_PER_MESSAGE:
+            payloads = [payload]
+        else:
+            chunks = self._split_blocks(blocks)
+            total = len(chunks)
+            payloads = [{**payload, 'blocks': chunks[0]}]
+            for k, chunk in enumerate(chunks[1:], start=2):
+                note = {
+                    "type": "context",
+                    "elements": [{"type": "mrkdwn", "text": f"_(continued {k}/{total})_"}]
+                }
+                payloads.append({**payload, 'blocks': [note] + chunk})
+        
+        session = get_session()
+        sent = 0
         try:
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(payload),
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            response.raise_for_status()
+            for part in payloads:
+                response = session.post(
+                    self.webhook_url,
+                    data=json_dumps(part),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=10
+                )
+                response.raise_for_status()
+                sent += 1
             return True
         except requests.exceptions.RequestException as e:
-            print(f"Failed to send Slack notification: {str(e)}")
+            if sent:
+                print(
+                    f"Slack notification partially sent: {sent}/{len(payloads)} "
+                    f"messages posted before failure: {str(e)}"
+                )
+            else:
+                print(f"Failed to send Slack notification: {str(e)}")
             return False
     
     def send_test_message(self) -> bool:
@@ -12,6 +12,10 @@ class TableReporter:
     Shows iOS & Android platforms with ad type breakdown.
     """
     
+    # Separator rules
+    RULE = "=" * 100
+    DIVIDER = "-" * 100
+    
     # Column widths for formatting
     LABEL_WIDTH = 14
     VALUE_WIDTH = 22
@@ -52,11 +56,11 @@ class TableReporter:
         end_date = date_range.get('end', 'N/A')
         
         # Header
-        output_lines.append("=" * 100)
+        output_lines.append(self.RULE)
         output_lines.append(f"📊 NETWORK DATA COMPARISON REPORT")
         output_lines.append(f"📅 Date Range: {start_date} to {end_date}")
         output_lines.append(f"🕐 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output_lines.append("=" * 100)
+        output_lines.append(self.RULE)
         output_lines.append("")
         
         # Get network names
@@ -97,7 +101,7 @@ class TableReporter:
         platform_icon = "🤖" if platform == "android" else "🍎"
         
         lines.append(f"{platform_icon} {platform.upper()} Platform")
-        lines.append("-" * 100)
+        lines.append(self.DIVIDER)
         
         # Build header row with network columns
         header = f"{'Ad Type':<{self.LABEL_WIDTH}}"
@@ -111,7 +115,7 @@ class TableReporter:
         for _ in network_names:
             sub_header += f" | {'Revenue':>{self.VALUE_WIDTH}}{'eCPM':>{self.VALUE_WIDTH}}{'Impressions':>{self.VALUE_WIDTH}}"
         lines.append(sub_header)
-        lines.append("-" * 100)
+        lines.append(self.DIVIDER)
         
         # Collect all ad types present
         all_ad_types = set()
@@ -159,7 +163,7 @@ class TableReporter:
             lines.append(row)
         
         # Platform totals row
-        lines.append("-" * 100)
+        lines.append(self.DIVIDER)
         total_row = f"{'TOTAL':<{self.LABEL_WIDTH}}"
         
         baseline_platform = None
@@ -208,13 +212,13 @@ class TableReporter:
         """
         lines = []
         lines.append("📈 OVERALL TOTALS (All Platforms)")
-        lines.append("=" * 100)
+        lines.append(self.RULE)
         
         # Header
         header = f"{'Network':<{self.LABEL_WIDTH + 5}}"
         header += f"{'Revenue':>{self.VALUE_WIDTH}}{'eCPM':>{self.VALUE_WIDTH}}{'Impressions':>{self.VALUE_WIDTH}}"
         lines.append(header)
-        lines.append("-" * 100)
+        lines.append(self.DIVIDER)
         
         baseline = None
         for idx, nd in enumerate(network_data):
@@ -404,11 +408,11 @@ class TableReporter:
                 
                 # Overall metric discrepancies
                 for disc in comp.get('discrepancies', []):
-                    if disc.get('over_threshold'):
-                        metric = disc['metric'].upper()
-                        v1 = disc['network1_value']
-                        v2 = disc['network2_value']
-                        pct = disc['difference_percentage']
+                    if disc.over_threshold:
+                        metric = disc.metric.upper()
+                        v1 = disc.network1_value
+                        v2 = disc.network2_value
+                        pct = disc.difference_percentage
                         pct_str = "∞" if pct == float('inf') else f"{pct:.1f}%"
                         
                         if metric == 'REVENUE':
@@ -1,20 +1,33 @@
 """Utility modules for Network Data Validation System."""
 from .token_cache import TokenCache
+from .http import get_session
+from .response_cache import ResponseCache
+from .redaction import redact
+from .json_utils import json_loads, json_dumps
 from .calculations import (
     calculate_ecpm,
     parse_delta_percentage,
+    exceeds_threshold,
     calculate_delta,
     format_delta,
     format_currency,
     format_number,
+    get_dates_with_data,
 )
 
 __all__ = [
     'TokenCache',
+    'get_session',
+    'ResponseCache',
+    'redact',
+    'json_loads',
+    'json_dumps',
     'calculate_ecpm',
     'parse_delta_percentage',
+    'exceeds_threshold',
     'calculate_delta',
     'format_delta',
     'format_currency',
     'format_number',
+    'get_dates_with_data',
 ]
@@ -3,7 +3,15 @@ Calculation utilities for Network Data Validation System.
 
 Provides shared calculation functions used across multiple modules.
 """
-from typing import Union
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Union
+
+
+# Common delta formats ("+10.5%", "-5%", "0.0%") parsed with one match
+_DELTA_RE = re.compile(r'\s*([+-]?\d+(?:\.\d+)?)%?\s*')
+_NA_VALUES = frozenset(('N/A', 'n/a', '-'))
 
 
 def calculate_ecpm(revenue: float, impressions: int) -> float:
@@ -56,21 +64,33 @@ def parse_delta_percentage(delta_str: Union[str, float, int]) -> float:
         >>> parse_delta_percentage("∞")
         inf
     """
-    if delta_str is None:
+    if delta_str is None or delta_str == '':
         return 0.0
     
     # Already a number
     if isinstance(delta_str, (int, float)):
         return float(delta_str)
     
-    delta_str = str(delta_str).strip().replace('%', '').replace('+', '')
+    return _parse_delta_str(str(delta_str))
+
+
+@lru_cache(maxsize=4096)
+def _parse_delta_str(delta_str: str) -> float:
+    """
+    Parse a delta string, memoized - report rows repeat a small set of values.
+    """
+    match = _DELTA_RE.fullmatch(delta_str)
+    if match:
+        return float(match.group(1))
+    
+    delta_str = delta_str.strip().replace('%', '').replace('+', '')
     
-    if not delta_str or delta_str in ('N/A', 'n/a', '-'):
+    if not delta_str or delta_str in _NA_VALUES:
         return 0.0
     
     # Handle infinity symbols
     if '∞' in delta_str or 'inf' in delta_str.lower():
-        return float('inf') if not delta_str.startswith('-') else float('-inf')
+        return -math.inf if delta_str.startswith('-') else math.inf
     
     try:
         return float(delta_str)
@@ -78,6 +98,33 @@ def parse_delta_percentage(delta_str: Union[str, float, int]) -> float:
         return 0.0
 
 
+def exceeds_threshold(delta: Union[str, float, int], threshold: float) -> bool:
+    """
+    Check whether a delta percentage is outside ±threshold.
+    
+    The single threshold rule shared by the Slack filters and network
+    summaries; infinite deltas always exceed it.
+    
+    Args:
+        delta: Delta percentage, as a number or a string like "+10.5%"
+        threshold: Threshold percentage (e.g., 10 means ±10%)
+        
+    Returns:
+        True if |delta| > threshold
+    
+    Example:
+        >>> exceeds_threshold("+12.0%", 10.0)
+        True
+        >>> exceeds_threshold(-9.5, 10.0)
+        False
+        >>> exceeds_threshold("∞", 10.0)
+        True
+    """
+    if not isinstance(delta, (int, float)):
+        delta = parse_delta_percentage(delta)
+    return delta > threshold or delta < -threshold
+
+
 def calculate_delta(base_value: float, compare_value: float) -> float:
     """
     Calculate percentage delta between two values.
@@ -158,3 +205,35 @@ def format_number(value: int) -> str:
         Formatted string like "1,234,567"
     """
     return f"{value:,}"
+
+
+def get_dates_with_data(daily_data: Dict[str, Any]) -> List[str]:
+    """
+    Find all dates that have valid data (impressions > 0) in a daily breakdown.
+    
+    Walks the nested {date: {platform: {ad_type: metrics}}} structure once,
+    stopping at the first ad type with impressions for each date.
+    
+    Args:
+        daily_data: Dictionary with date keys containing platform/ad_type data
+        
+    Returns:
+        Sorted list of date strings (YYYY-MM-DD) with valid data
+    
+    Example:
+        >>> get_dates_with_data({
+        ...     '2025-01-02': {'ios': {'banner': {'impressions': 5}}},
+        ...     '2025-01-01': {'ios': {'banner': {'impressions': 0}}},
+        ... })
+        ['2025-01-02']
+    """
+    return sorted(
+        date_str
+        for date_str, date_data in daily_data.items()
+        if any(
+            isinstance(ad_data, dict) and ad_data.get('impressions', 0) > 0
+            for platform_data in date_data.values()
+            if isinstance(platform_data, dict)
+            for ad_data in platform_data.values()
+        )
+    )
@@ -0,0 +1,81 @@
+"""
+Shared synchronous HTTP session for Network Data Validation System.
+Reuses keep-alive connections for blocking calls (e.g. Slack webhooks).
+"""
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 5
+POOL_MAXSIZE = 20
+
+# Transient failures retried inline on the pooled connection. Only
+# idempotent methods are retried on 5xx and read errors - a webhook POST
+# that Slack accepted but answered slowly would otherwise be posted twice
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(['GET'])
+
+# Statuses that mean the request was rejected unprocessed, so retrying is
+# safe for any method (including POST)
+UNPROCESSED_STATUS_CODES = frozenset([429])
+
+_session: Optional[requests.Session] = None
+
+
+class _SafeRetry(Retry):
+    """Retry policy that also retries non-idempotent requests on 429."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if not self._is_method_retryable(method):
+            return status_code in UNPROCESSED_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a requests Session with a pooled HTTPS adapter.
+
+    Rate limits and 5xx responses are retried by urllib3 with backoff
+    (honouring Retry-After) without dropping the keep-alive connection.
+    POSTs are only retried on 429, which Slack returns without posting.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_SafeRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide shared requests Session.
+
+    The session is created lazily on first use so that connection
+    pooling and keep-alive are shared by every synchronous HTTP caller.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        _session = _build_session()
+        logger.debug("Created shared HTTP session")
+    return _session
@@ -0,0 +1,23 @@
+"""
+JSON helpers for Network Data Validation System.
+Uses orjson when installed and falls back to the standard library.
+"""
+import json
+
+try:
+    # orjson parses large report payloads several times faster than stdlib
+    # json and accepts bytes directly, skipping the intermediate str decode
+    import orjson
+    json_loads = orjson.loads
+    # Serializes straight to UTF-8 bytes, ready to use as a request body
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib exception regardless of which parser is active
+JSONDecodeError = json.JSONDecodeError
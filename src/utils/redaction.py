@@ -0,0 +1,33 @@
+"""
+Credential redaction helpers for Network Data Validation System.
+Keeps secrets out of logs and console output in one auditable place.
+"""
+from typing import Optional
+
+
+def redact(value: Optional[str], head: int = 4, tail: int = 4) -> str:
+    """
+    Redact a secret, keeping only a short prefix and suffix for identification.
+
+    Values too short to keep both ends without revealing most of the
+    secret are fully masked.
+
+    Args:
+        value: Secret string (API key, token, session ID, ...)
+        head: Number of leading characters to keep
+        tail: Number of trailing characters to keep
+
+    Returns:
+        Redacted string safe for logging
+
+    Examples:
+        >>> redact("abcdefghijklmnopqrstuvwxyz")
+        'abcd...wxyz'
+        >>> redact("short")
+        '***'
+        >>> redact(None)
+        '***'
+    """
+    if not value or len(value) <= 2 * (head + tail):
+        return "***"
+    return f"{value[:head]}...{value[-tail:]}"
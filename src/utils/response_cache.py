@@ -0,0 +1,132 @@
+"""
+Opt-in file-based HTTP response cache for Network Data Validation System.
+Lets iterative test runs replay vendor API responses instead of re-fetching.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    File-based cache of raw API response bodies.
+
+    Disabled unless the NDVS_TEST_CACHE=1 environment variable is set, so
+    production runs always hit the vendor APIs. Intended for developers
+    re-running a network test script while iterating on parsing or
+    aggregation code - reports for past dates do not change between runs.
+
+    Usage:
+        cache = ResponseCache.from_env()
+        if cache:
+            key = cache.make_key('GET', url, params=params)
+            body = cache.get(key)
+    """
+
+    ENV_VAR = "NDVS_TEST_CACHE"
+    DEFAULT_CACHE_DIR = ".ndvs_test_cache"
+    DEFAULT_TTL_SECONDS = 3600
+    CACHE_FILE_SUFFIX = ".json"
+    # Per-request signature params (e.g. Mintegral's timestamp-signed
+    # sign/time) - keying on them would make every request a miss
+    VOLATILE_PARAMS = frozenset({'sign', 'time', 'timestamp'})
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            cache_dir: Directory for cached responses. Defaults to '.ndvs_test_cache/'
+            ttl_seconds: Lifetime of a cached response in seconds
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(self.DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """
+        Create a cache only when enabled via environment variable.
+
+        Returns:
+            ResponseCache instance if NDVS_TEST_CACHE=1, None otherwise
+        """
+        if os.environ.get(cls.ENV_VAR) != "1":
+            return None
+        return cls()
+
+    @classmethod
+    def make_key(cls, method: str, url: str, **request_kwargs: Any) -> str:
+        """
+        Build a cache key from the request that produced a response.
+
+        Query params and JSON/form bodies are part of the key so that
+        e.g. report POSTs for different dates are cached separately.
+        Headers are deliberately excluded (they carry credentials), as are
+        VOLATILE_PARAMS that change on every request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **request_kwargs: aiohttp request kwargs (params, json, data, ...)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        params = request_kwargs.get('params')
+        if isinstance(params, dict):
+            params = {k: v for k, v in params.items() if k not in cls.VOLATILE_PARAMS}
+        key_data: Dict[str, Any] = {
+            'method': method.upper(),
+            'url': url,
+            'params': params,
+            'json': request_kwargs.get('json'),
+            'data': request_kwargs.get('data'),
+        }
+        raw = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _get_cache_file(self, key: str) -> Path:
+        """Get the cache file path for a key."""
+        return self.cache_dir / f"{key}{self.CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Load a cached response body if it has not expired.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Raw response body, or None on miss/expiry
+        """
+        cache_file = self._get_cache_file(key)
+
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.ttl_seconds:
+                return None
+            body = cache_file.read_bytes()
+        except OSError:
+            return None
+
+        logger.debug("Response cache hit: %.12s", key)
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        """
+        Store a response body.
+
+        Args:
+            key: Cache key from make_key()
+            body: Raw response body
+        """
+        try:
+            self._get_cache_file(key).write_bytes(body)
+        except OSError as e:
+            logger.warning(f"Error writing response cache entry: {e}")
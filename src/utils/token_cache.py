@@ -63,12 +63,11 @@ class TokenCache:
         cache_file = self._get_cache_file(network)
         
         if not cache_file.exists():
-            logger.debug(f"No cached token found for {network}")
+            logger.debug("No cached token found for %s", network)
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            data = json.loads(cache_file.read_text(encoding='utf-8'))
             
             # Check expiry
             expires_at = data.get('expires_at', 0)
@@ -78,7 +77,7 @@ class TokenCache:
                 return None
             
             remaining = int(expires_at - time.time())
-            logger.debug(f"Using cached token for {network} (expires in {remaining}s)")
+            logger.debug("Using cached token for %s (expires in %ds)", network, remaining)
             return data
             
         except (json.JSONDecodeError, IOError) as e:
@@ -124,8 +123,9 @@ class TokenCache:
         }
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialize fully first, then write in a single call - json.dump
+            # would issue one write per encoded chunk
+            cache_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
             
             logger.info(f"Cached token for {network} (expires in {effective_expires_in}s)")
             return True
@@ -149,7 +149,7 @@ class TokenCache:
         try:
             if cache_file.exists():
                 cache_file.unlink()
-                logger.debug(f"Deleted cached token for {network}")
+                logger.debug("Deleted cached token for %s", network)
             return True
         except IOError as e:
             logger.error(f"Error deleting token for {network}: {e}")
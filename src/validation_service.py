@@ -6,17 +6,22 @@ Optimized with async/await for parallel network fetching.
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Tuple
 
 from src.config import Config
-from src.fetchers import ApplovinFetcher, FetcherFactory
+from src.fetchers import ApplovinFetcher, FetcherFactory, MetaFetcher
 from src.notifiers import SlackNotifier
 from src.exporters import GCSExporter
 from src.enums import NetworkName
+from src.utils import get_dates_with_data
 
 logger = logging.getLogger(__name__)
 
+# Console banner rule
+_BAR = "=" * 80
+
 
 class ValidationService:
     """Main service for comparing MAX data with network data."""
@@ -138,12 +143,12 @@ class ValidationService:
                           If None, fetches all configured networks.
             no_slack: If True, skip sending report to Slack
         """
-        from datetime import timezone
-        
         now_utc = datetime.now(timezone.utc)
-        logger.info(f"Starting Network Comparison Report at {now_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-        print(f"[{now_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC] Starting Network Comparison Report...")
-        print("=" * 80)
+        today_utc = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+        now_label = now_utc.strftime('%Y-%m-%d %H:%M:%S')
+        logger.info(f"Starting Network Comparison Report at {now_label} UTC")
+        print(f"[{now_label} UTC] Starting Network Comparison Report...")
+        print(_BAR)
         
         # Calculate date range - default 7 days for comprehensive comparison
         validation_config = self.config.get_validation_config()
@@ -163,28 +168,32 @@ class ValidationService:
             dt_exchange_delay_days = 0
         else:
             # Normal mode - use yesterday for standard networks (T-1)
-            end_date = now_utc.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+            end_date = today_utc - timedelta(days=1)
             start_date = end_date - timedelta(days=date_range_days - 1)
             
             # Meta requires delay for stable daily data - use fetcher's configured delay
-            from .fetchers.meta_fetcher import MetaFetcher
             meta_delay_days = MetaFetcher.DATA_DELAY_DAYS
-            meta_end_date = now_utc.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=meta_delay_days)
+            meta_end_date = today_utc - timedelta(days=meta_delay_days)
             meta_start_date = meta_end_date - timedelta(days=date_range_days - 1)
             
             # DT Exchange: Try T-1 but API may not have data yet (up to 12h+ delay)
             # If T-1 has no data, it will be filtered out before GCS export
             # Docs: https://developer.digitalturbine.com/hc/en-us/articles/8101286018717
             dt_exchange_delay_days = 1  # Try T-1, filter empty days later
-            dt_exchange_end_date = now_utc.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=dt_exchange_delay_days)
+            dt_exchange_end_date = today_utc - timedelta(days=dt_exchange_delay_days)
             dt_exchange_start_date = dt_exchange_end_date - timedelta(days=date_range_days - 1)
         
-        print(f"📅 Date range (UTC): {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ({date_range_days} days)")
+        # Date labels for console output, formatted once
+        start_str, end_str = start_date.date().isoformat(), end_date.date().isoformat()
+        meta_start_str, meta_end_str = meta_start_date.date().isoformat(), meta_end_date.date().isoformat()
+        dt_start_str, dt_end_str = dt_exchange_start_date.date().isoformat(), dt_exchange_end_date.date().isoformat()
+        
+        print(f"📅 Date range (UTC): {start_str} to {end_str} ({date_range_days} days)")
         if meta_delay_days > 0:
-            print(f"📅 Meta date range (UTC, T-{meta_delay_days}): {meta_start_date.strftime('%Y-%m-%d')} to {meta_end_date.strftime('%Y-%m-%d')}")
+            print(f"📅 Meta date range (UTC, T-{meta_delay_days}): {meta_start_str} to {meta_end_str}")
         if dt_exchange_delay_days > 0:
-            print(f"📅 DT Exchange date range (UTC, T-{dt_exchange_delay_days}): {dt_exchange_start_date.strftime('%Y-%m-%d')} to {dt_exchange_end_date.strftime('%Y-%m-%d')}")
-        print("=" * 80)
+            print(f"📅 DT Exchange date range (UTC, T-{dt_exchange_delay_days}): {dt_start_str} to {dt_end_str}")
+        print(_BAR)
         
         if not self.applovin_fetcher:
             logger.error("AppLovin fetcher not configured")
@@ -197,20 +206,28 @@ class ValidationService:
             max_data = await self.applovin_fetcher.fetch_data(start_date, end_date)
             max_rows = max_data.get('comparison_rows', [])
             logger.info(f"Retrieved {len(max_rows)} rows from MAX")
-            print(f"   ✅ Retrieved {len(max_rows)} rows from MAX ({start_date.strftime('%Y-%m-%d')})")
+            print(f"   ✅ Retrieved {len(max_rows)} rows from MAX ({start_str})")
         except Exception as e:
             logger.error(f"Failed to fetch MAX data: {e}")
             print(f"   ❌ Error: {str(e)}")
             return {'success': False, 'message': f'Failed to fetch MAX data: {str(e)}'}
         
+        # MAX rows by (start, end) - delayed networks often use the same range
+        # as the standard networks, so their report can be reused as-is
+        max_rows_by_range = {(start_date, end_date): max_rows}
+        
         # Step 1b: Fetch separate MAX data for Meta using T-2 dates
         max_rows_meta = []
         should_fetch_meta = 'meta' in self.network_fetchers and (not only_networks or 'meta' in only_networks)
-        if should_fetch_meta:
+        if should_fetch_meta and (meta_start_date, meta_end_date) in max_rows_by_range:
+            max_rows_meta = max_rows_by_range[(meta_start_date, meta_end_date)]
+            print("   ♻️ Reusing MAX data for Meta (same date range)")
+        elif should_fetch_meta:
             try:
-                print(f"   📥 Fetching MAX data for Meta (T-{meta_delay_days}: {meta_end_date.strftime('%Y-%m-%d')})...")
+                print(f"   📥 Fetching MAX data for Meta (T-{meta_delay_days}: {meta_end_str})...")
                 max_data_meta = await self.applovin_fetcher.fetch_data(meta_start_date, meta_end_date)
                 max_rows_meta = max_data_meta.get('comparison_rows', [])
+                max_rows_by_range[(meta_start_date, meta_end_date)] = max_rows_meta
                 logger.info(f"Retrieved {len(max_rows_meta)} rows from MAX for Meta comparison")
                 print(f"   ✅ Retrieved {len(max_rows_meta)} rows from MAX for Meta comparison")
             except Exception as e:
@@ -221,9 +238,12 @@ class ValidationService:
         # Step 1c: Fetch separate MAX data for DT Exchange using T-2 dates
         max_rows_dt_exchange = []
         should_fetch_dt = 'dt_exchange' in self.network_fetchers and dt_exchange_delay_days > 0 and (not only_networks or 'dt_exchange' in only_networks)
-        if should_fetch_dt:
+        if should_fetch_dt and (dt_exchange_start_date, dt_exchange_end_date) in max_rows_by_range:
+            max_rows_dt_exchange = max_rows_by_range[(dt_exchange_start_date, dt_exchange_end_date)]
+            print("   ♻️ Reusing MAX data for DT Exchange (same date range)")
+        elif should_fetch_dt:
             try:
-                print(f"   📥 Fetching MAX data for DT Exchange (T-{dt_exchange_delay_days}: {dt_exchange_end_date.strftime('%Y-%m-%d')})...")
+                print(f"   📥 Fetching MAX data for DT Exchange (T-{dt_exchange_delay_days}: {dt_end_str})...")
                 max_data_dt = await self.applovin_fetcher.fetch_data(dt_exchange_start_date, dt_exchange_end_date)
                 max_rows_dt_exchange = max_data_dt.get('comparison_rows', [])
                 logger.info(f"Retrieved {len(max_rows_dt_exchange)} rows from MAX for DT Exchange comparison")
@@ -276,9 +296,9 @@ class ValidationService:
         
         # Display table
         if comparison_rows:
-            print(f"\n{'=' * 80}")
+            print(f"\n{_BAR}")
             print("📈 NETWORK COMPARISON REPORT")
-            print("=" * 80)
+            print(_BAR)
             
             table = self._generate_comparison_table(comparison_rows)
             print(table)
@@ -289,10 +309,12 @@ class ValidationService:
                 threshold = self.config.get_slack_revenue_delta_threshold()
                 min_revenue = self.config.get_slack_min_revenue_for_alerts()
                 
+                # Lowercased fetched-network keys, shared by the row and
+                # network_data filters below
+                network_keys_lower = {n.lower() for n in only_networks} if only_networks else None
+                
                 # Filter rows to only include networks that were fetched
                 if only_networks:
-                    # Get network display names for filtering
-                    network_keys_lower = {n.lower() for n in only_networks}
                     slack_rows = []
                     for row in comparison_rows:
                         network_key = self._get_network_key(row.get('network', ''))
@@ -305,13 +327,12 @@ class ValidationService:
                     slack_rows = comparison_rows
                     slack_totals = totals
                 
-                # Get date range for report
-                dates = sorted(set(row.get('date', '') for row in slack_rows if row.get('date')))
-                end_date = datetime.strptime(dates[-1], '%Y-%m-%d') if dates else datetime.now()
+                # Report end date is the latest row date; max() needs no set or sort
+                last_date = max((row['date'] for row in slack_rows if row.get('date')), default=None)
+                end_date = datetime.fromisoformat(last_date) if last_date else datetime.now()
                 
                 # Filter network_data to only include fetched networks
                 if only_networks:
-                    network_keys_lower = {n.lower() for n in only_networks}
                     slack_network_data = {
                         k: v for k, v in network_data.items() 
                         if k.lower() in network_keys_lower
@@ -393,7 +414,6 @@ class ValidationService:
         Returns:
             Dictionary mapping network names to their fetched data
         """
-        import time
         start_time = time.time()
         
         # Use provided dates or fallback to standard dates
@@ -428,21 +448,20 @@ class ValidationService:
                     # Try earlier dates
                     for fallback_day in range(1, max_fallback_days + 1):
                         earlier_date = fetch_end - timedelta(days=fallback_day)
-                        logger.info(f"{network_name}: No data for {fetch_end.strftime('%Y-%m-%d')}, trying {earlier_date.strftime('%Y-%m-%d')}...")
-                        print(f"   ⏳ {network_name}: No data, trying {earlier_date.strftime('%Y-%m-%d')}...")
+                        earlier_str = earlier_date.date().isoformat()
+                        logger.info(f"{network_name}: No data for {fetch_end.strftime('%Y-%m-%d')}, trying {earlier_str}...")
+                        print(f"   ⏳ {network_name}: No data, trying {earlier_str}...")
                         
                         data = await fetcher.fetch_data(earlier_date, earlier_date)
                         if data.get('impressions', 0) > 0:
-                            logger.info(f"{network_name}: Found data for {earlier_date.strftime('%Y-%m-%d')}")
+                            logger.info(f"{network_name}: Found data for {earlier_str}")
                             break
                 
                 # For DT Exchange, log which dates have data (to show last report date)
                 if network_name == 'dt_exchange':
                     daily_data = data.get('daily_data', {})
                     if daily_data:
-                        dates_with_data = sorted([d for d, v in daily_data.items() 
-                                                  if any(p.get(a, {}).get('impressions', 0) > 0 
-                                                        for p in v.values() for a in p.keys())])
+                        dates_with_data = get_dates_with_data(daily_data)
                         if dates_with_data:
                             last_date = dates_with_data[-1]
                             total_days = len(daily_data)
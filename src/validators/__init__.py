@@ -1,6 +1,6 @@
 """
 Validators package initialization.
 """
-from .data_validator import DataValidator
+from .data_validator import DataValidator, MetricDiscrepancy
 
-__all__ = ['DataValidator']
+__all__ = ['DataValidator', 'MetricDiscrepancy']
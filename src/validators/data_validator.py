@@ -1,7 +1,43 @@
 """
 Data validator for comparing network metrics.
 """
-from typing import Dict, List, Any, Tuple
+import sys
+from dataclasses import dataclass
+from math import inf as _INF
+from typing import Dict, List, Any, Sequence, Tuple
+
+
+# Metrics compared by default. Immutable, so the default argument is shared
+# safely; literal keys are already interned by the compiler
+DEFAULT_METRICS = ('revenue', 'impressions', 'ecpm')
+
+# Platforms compared in platform/ad-type breakdowns
+PLATFORMS = ('android', 'ios')
+
+# Empty platform totals used when a network has no data for a platform
+_EMPTY_PLATFORM = {'revenue': 0, 'impressions': 0, 'ecpm': 0, 'ad_data': {}}
+
+
+@dataclass(frozen=True, slots=True)
+class MetricDiscrepancy:
+    """Comparison of one metric between a baseline and another network."""
+    metric: str
+    network1_value: float
+    network2_value: float
+    difference: float
+    difference_percentage: float
+    over_threshold: bool
+
+
+def _diff_percentage(base: float, other: float) -> float:
+    """
+    Absolute percentage difference of other vs base.
+    
+    A zero baseline gives 0.0 when other is also zero, otherwise infinity.
+    """
+    if base:
+        return abs((other - base) / base) * 100
+    return 0.0 if other == 0 else _INF
 
 
 class DataValidator:
@@ -20,7 +56,7 @@ class DataValidator:
         self, 
         data1: Dict[str, Any], 
         data2: Dict[str, Any],
-        metrics: List[str] = ['revenue', 'impressions', 'ecpm']
+        metrics: Sequence[str] = DEFAULT_METRICS
     ) -> Dict[str, Any]:
         """
         Compare metrics between two network data sets.
@@ -30,6 +66,29 @@ class DataValidator:
             data2: Second network data
             metrics: List of metrics to compare
             
+        Returns:
+            Dictionary containing comparison results
+        """
+        return self._compare_metrics(
+            data1, data2, metrics, [data1.get(metric, 0) for metric in metrics]
+        )
+    
+    def _compare_metrics(
+        self,
+        data1: Dict[str, Any],
+        data2: Dict[str, Any],
+        metrics: Sequence[str],
+        values1: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Compare metrics using precomputed baseline values.
+        
+        Args:
+            data1: First (baseline) network data
+            data2: Second network data
+            metrics: List of metrics to compare
+            values1: Baseline value for each metric, in metrics order
+            
         Returns:
             Dictionary containing comparison results
         """
@@ -43,35 +102,27 @@ class DataValidator:
             'discrepancies': []
         }
         
-        for metric in metrics:
-            value1 = data1.get(metric, 0)
+        threshold = self.threshold_percentage
+        for metric, value1 in zip(metrics, values1):
             value2 = data2.get(metric, 0)
             
-            # Calculate percentage difference
-            if value1 == 0 and value2 == 0:
-                diff_percentage = 0.0
-            elif value1 == 0:
-                # When baseline is 0, any non-zero value is considered a large discrepancy
-                diff_percentage = float('inf') if value2 != 0 else 0.0
-            else:
-                diff_percentage = abs((value2 - value1) / value1) * 100
+            # When baseline is 0, any non-zero value is considered a large discrepancy
+            diff_percentage = _diff_percentage(value1, value2)
             
-            # Check threshold (treat infinity as exceeding threshold)
-            is_over_threshold = (diff_percentage != 0.0 and 
-                                (diff_percentage == float('inf') or 
-                                 diff_percentage > self.threshold_percentage))
+            # Check threshold (infinity always exceeds it)
+            is_over_threshold = diff_percentage != 0.0 and diff_percentage > threshold
             
             if is_over_threshold:
                 results['has_discrepancy'] = True
             
-            results['discrepancies'].append({
-                'metric': metric,
-                'network1_value': value1,
-                'network2_value': value2,
-                'difference': value2 - value1,
-                'difference_percentage': diff_percentage if diff_percentage != float('inf') else float('inf'),
-                'over_threshold': is_over_threshold
-            })
+            results['discrepancies'].append(MetricDiscrepancy(
+                metric=metric,
+                network1_value=value1,
+                network2_value=value2,
+                difference=value2 - value1,
+                difference_percentage=diff_percentage,
+                over_threshold=is_over_threshold
+            ))
         
         return results
     
@@ -80,7 +131,24 @@ class DataValidator:
         Compare platform-level totals and ad-type breakdowns between baseline and other network.
         Returns a dictionary with platform discrepancies and ad-type details.
         """
-        platforms = ['android', 'ios']
+        return self._compare_platforms(baseline, self._get_platforms(baseline), other)
+    
+    @staticmethod
+    def _get_platforms(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Resolve each compared platform's totals, defaulting to empty ones."""
+        platform_data = data.get('platform_data', {})
+        return {plat: platform_data.get(plat, _EMPTY_PLATFORM) for plat in PLATFORMS}
+    
+    def _compare_platforms(
+        self,
+        baseline: Dict[str, Any],
+        base_platforms: Dict[str, Dict[str, Any]],
+        other: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Compare platforms using the baseline's pre-resolved platform totals.
+        """
+        other_platforms = self._get_platforms(other)
         result = {
             'network1': baseline['network'],
             'network2': other['network'],
@@ -88,9 +156,10 @@ class DataValidator:
             'has_discrepancy': False
         }
         
-        for plat in platforms:
-            base_plat = baseline.get('platform_data', {}).get(plat, {'revenue':0,'impressions':0,'ecpm':0,'ad_data':{}})
-            other_plat = other.get('platform_data', {}).get(plat, {'revenue':0,'impressions':0,'ecpm':0,'ad_data':{}})
+        threshold = self.threshold_percentage
+        for plat in PLATFORMS:
+            base_plat = base_platforms[plat]
+            other_plat = other_platforms[plat]
             
             plat_comp = {
                 'revenue': {
@@ -114,15 +183,8 @@ class DataValidator:
                 a1 = base_plat.get('ad_data', {}).get(ad_key, {'revenue':0,'impressions':0,'ecpm':0})
                 a2 = other_plat.get('ad_data', {}).get(ad_key, {'revenue':0,'impressions':0,'ecpm':0})
                 # compute diff percent for revenue
-                base_rev = a1.get('revenue', 0)
-                other_rev = a2.get('revenue', 0)
-                if base_rev == 0 and other_rev == 0:
-                    rev_pct = 0.0
-                elif base_rev == 0:
-                    rev_pct = float('inf')
-                else:
-                    rev_pct = abs((other_rev - base_rev)/base_rev) * 100
-                over_rev = rev_pct != 0.0 and (rev_pct == float('inf') or rev_pct > self.threshold_percentage)
+                rev_pct = _diff_percentage(a1.get('revenue', 0), a2.get('revenue', 0))
+                over_rev = rev_pct != 0.0 and rev_pct > threshold
                 
                 plat_comp['ad_types'][ad_key] = {
                     'network1': a1,
@@ -140,7 +202,7 @@ class DataValidator:
     def compare_multiple_networks(
         self,
         network_data: List[Dict[str, Any]],
-        metrics: List[str] = ['revenue', 'impressions', 'ecpm'],
+        metrics: Sequence[str] = DEFAULT_METRICS,
         baseline_name: str = 'Applovin Max'
     ) -> List[Dict[str, Any]]:
         """
@@ -150,22 +212,26 @@ class DataValidator:
         if len(network_data) < 2:
             raise ValueError("Need at least 2 networks to compare")
         
-        # find baseline by name
-        baseline = None
-        for nd in network_data:
-            if nd.get('network') == baseline_name:
-                baseline = nd
-                break
-        if baseline is None:
-            # fallback to first
-            baseline = network_data[0]
+        # find baseline by name, fallback to first
+        baseline = next(
+            (nd for nd in network_data if nd.get('network') == baseline_name),
+            network_data[0]
+        )
+        
+        # Intern caller-supplied metric names (e.g. read from config) once so
+        # the per-network dict lookups hit the identity fast path
+        metrics = tuple(sys.intern(metric) for metric in metrics)
+        
+        # Baseline lookups are shared by every comparison, resolve them once
+        baseline_values = [baseline.get(metric, 0) for metric in metrics]
+        baseline_platforms = self._get_platforms(baseline)
         
         comparisons = []
         for nd in network_data:
             if nd is baseline:
                 continue
-            overall = self.compare_metrics(baseline, nd, metrics)
-            platform_comp = self.compare_platforms(baseline, nd)
+            overall = self._compare_metrics(baseline, nd, metrics, baseline_values)
+            platform_comp = self._compare_platforms(baseline, baseline_platforms, nd)
             overall['platform_comparison'] = platform_comp
             comparisons.append(overall)
         
@@ -8,37 +8,67 @@ Usage:
     2. Run: python test_networkname.py
     3. Optional args:
        --auth-only     Only test authentication
-       --full-fetch    Run full fetch (default: auth + report test)
+       --check-auth    Run the auth probe before the report test
+       --full-fetch    Run full fetch (default: report test)
+       --verbose       Echo non-secret identifiers (e.g. publisher ID)
 """
 import sys
-import io
 import json
 import asyncio
 from datetime import datetime, timedelta, timezone
 
-# Fix console encoding for Windows
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-
 from src.config import Config
 
 # UPDATE THIS IMPORT
 from src.fetchers.networkname_fetcher import NetworkNameFetcher
 
 
+# Plain ASCII status markers - safe on any console encoding (including
+# Windows cp1252), so stdout does not need to be re-wrapped as UTF-8
+_OK = "[OK]"
+_ERR = "[FAIL]"
+_INFO = "[INFO]"
+
+# Separator rules, built once
+_BAR = "=" * 60
+_SUB_BAR = "-" * 60
+_RULES = {"=": _BAR, "-": _SUB_BAR}
+
+# Credential checks, built once
+_PLACEHOLDER_PREFIXES = ("YOUR_",)
+_SENSITIVE_MARKERS = ("key", "token", "password", "secret")
+# Fixed mask - reveals neither characters nor length of a secret
+_REDACTED = "[REDACTED]"
+_SET = "(set)"
+
+
 def print_separator(title: str = "", char: str = "="):
     """Print a separator line."""
-    print(f"\n{char*60}")
+    rule = _RULES.get(char) or char * 60
+    print(f"\n{rule}")
     if title:
         print(f"  {title}")
-        print(f"{char*60}")
+        print(rule)
 
 
-def check_credentials(config: dict) -> bool:
+def _display_value(field: str, value, verbose: bool = False) -> str:
+    """
+    Value to print for a config field.
+    Secrets are always masked; other identifiers are only echoed with --verbose.
+    """
+    if any(s in field.lower() for s in _SENSITIVE_MARKERS):
+        return _REDACTED if value else "(empty)"
+    if verbose or not isinstance(value, str):
+        return value
+    return _SET if value else "(empty)"
+
+
+def check_credentials(config: dict, verbose: bool = False) -> bool:
     """
     Check if credentials are properly configured.
     Returns True if valid, False otherwise.
     """
-    print_separator("🔍 CREDENTIAL CHECK")
+    print_separator("CREDENTIAL CHECK")
     
     is_valid = True
     required_fields = ['api_key', 'publisher_id']  # UPDATE BASED ON NETWORK
@@ -48,93 +78,133 @@ def check_credentials(config: dict) -> bool:
         
         # Check for placeholder values
         if not value:
-            print(f"   ❌ {field}: MISSING")
+            print(f"   {_ERR} {field}: MISSING")
             is_valid = False
-        elif value.startswith("YOUR_") or value == "":
-            print(f"   ❌ {field}: PLACEHOLDER - please update config.yaml")
+        elif value.startswith(_PLACEHOLDER_PREFIXES):
+            print(f"   {_ERR} {field}: PLACEHOLDER - please update config.yaml")
             is_valid = False
         else:
-            # Mask sensitive values
-            if any(s in field.lower() for s in ['key', 'token', 'password', 'secret']):
-                display_value = f"{'*' * min(len(value), 10)}... ({len(value)} chars)"
-            else:
-                display_value = value
-            print(f"   ✅ {field}: {display_value}")
+            print(f"   {_OK} {field}: {_display_value(field, value, verbose)}")
     
     return is_valid
 
 
+# Report line templates (parsed once, filled per row with format_map)
+_PLATFORM_HEADER_TMPL = (
+    "\n      {platform}:\n"
+    "         Revenue: ${revenue:.2f}\n"
+    "         Impressions: {impressions:,}\n"
+    "         eCPM: ${ecpm:.2f}\n"
+    "\n         Ad Types:"
+)
+_AD_ROW_TMPL = "            {ad_type}: ${revenue:.2f} / {impressions:,} impr / ${ecpm:.2f} eCPM"
+
+
+def flatten_results(data: dict) -> list:
+    """
+    Flatten platform/ad type breakdown into rows in a single traversal.
+    
+    Returns:
+        List of (platform_row, ad_rows) tuples; each row is a dict with
+        revenue, impressions and ecpm plus its platform / ad_type name
+    """
+    platform_data = data.get('platform_data') or {}
+    rows = []
+    for platform in ('android', 'ios'):
+        pdata = platform_data.get(platform) or {}
+        ad_data = pdata.get('ad_data') or {}
+        ad_rows = []
+        for ad_type in ('banner', 'interstitial', 'rewarded'):
+            adata = ad_data.get(ad_type) or {}
+            ad_rows.append({
+                'ad_type': ad_type,
+                'revenue': adata.get('revenue', 0),
+                'impressions': adata.get('impressions', 0),
+                'ecpm': adata.get('ecpm', 0),
+            })
+        platform_row = {
+            'platform': platform.upper(),
+            'revenue': pdata.get('revenue', 0),
+            'impressions': pdata.get('impressions', 0),
+            'ecpm': pdata.get('ecpm', 0),
+        }
+        rows.append((platform_row, ad_rows))
+    return rows
+
+
+def format_results(data: dict) -> str:
+    """Build the fetched data report as a single string."""
+    date_range = data.get('date_range') or {}
+    lines = [
+        f"\n   Network: {data.get('network', 'Unknown')}",
+        f"   Date Range: {date_range.get('start')} to {date_range.get('end')}",
+        "\n   TOTALS:",
+        f"      Revenue: ${data.get('revenue', 0):.2f}",
+        f"      Impressions: {data.get('impressions', 0):,}",
+        f"      eCPM: ${data.get('ecpm', 0):.2f}",
+        "\n   PLATFORM BREAKDOWN:",
+    ]
+    
+    for platform_row, ad_rows in flatten_results(data):
+        if platform_row['impressions'] <= 0:
+            continue
+        
+        lines.append(_PLATFORM_HEADER_TMPL.format_map(platform_row))
+        lines.extend(
+            _AD_ROW_TMPL.format_map(ad_row)
+            for ad_row in ad_rows
+            if ad_row['impressions'] > 0
+        )
+    
+    return "\n".join(lines)
+
+
 def print_results(data: dict):
     """Print fetched data in a readable format."""
-    print_separator("📊 FETCH RESULTS")
-    
-    print(f"\n   Network: {data.get('network', 'Unknown')}")
-    print(f"   Date Range: {data.get('date_range', {}).get('start')} to {data.get('date_range', {}).get('end')}")
-    
-    print(f"\n   💰 TOTALS:")
-    print(f"      Revenue: ${data.get('revenue', 0):.2f}")
-    print(f"      Impressions: {data.get('impressions', 0):,}")
-    print(f"      eCPM: ${data.get('ecpm', 0):.2f}")
-    
-    print(f"\n   📱 PLATFORM BREAKDOWN:")
-    for platform in ['android', 'ios']:
-        pdata = data.get('platform_data', {}).get(platform, {})
-        revenue = pdata.get('revenue', 0)
-        impressions = pdata.get('impressions', 0)
-        ecpm = pdata.get('ecpm', 0)
-        
-        if impressions > 0:
-            print(f"\n      {platform.upper()}:")
-            print(f"         Revenue: ${revenue:.2f}")
-            print(f"         Impressions: {impressions:,}")
-            print(f"         eCPM: ${ecpm:.2f}")
-            
-            print(f"\n         Ad Types:")
-            for ad_type in ['banner', 'interstitial', 'rewarded']:
-                adata = pdata.get('ad_data', {}).get(ad_type, {})
-                if adata.get('impressions', 0) > 0:
-                    print(f"            {ad_type}: ${adata.get('revenue', 0):.2f} / {adata.get('impressions', 0):,} impr / ${adata.get('ecpm', 0):.2f} eCPM")
+    print_separator("FETCH RESULTS")
+    
+    # Emit the whole report with a single write instead of one print per line
+    sys.stdout.write(format_results(data) + "\n")
 
 
 async def main():
     """Main async test function."""
-    print_separator("🧪 NETWORKNAME FETCHER TEST (ASYNC)", "=")
+    print_separator("NETWORKNAME FETCHER TEST (ASYNC)", "=")
     
     # Parse command line arguments
     auth_only = '--auth-only' in sys.argv
+    check_auth = '--check-auth' in sys.argv
     full_fetch = '--full-fetch' in sys.argv
+    verbose = '--verbose' in sys.argv
     
     # ========================================
     # Step 1: Load Configuration
     # ========================================
-    print_separator("📋 CONFIGURATION")
+    print_separator("CONFIGURATION")
     
     config = Config()
     network_config = config.get_networkname_config()  # UPDATE THIS METHOD NAME
     
     print(f"\n   Config loaded:")
     for key, value in network_config.items():
-        if any(s in key.lower() for s in ['key', 'token', 'password', 'secret']):
-            print(f"      {key}: {'*' * 10}")
-        else:
-            print(f"      {key}: {value}")
+        print(f"      {key}: {_display_value(key, value, verbose)}")
     
     if not network_config.get('enabled', False):
-        print("\n   ❌ Network is disabled in config.yaml")
+        print(f"\n   {_ERR} Network is disabled in config.yaml")
         print("      Set 'enabled: true' to run tests")
         return
     
     # ========================================
     # Step 2: Check Credentials
     # ========================================
-    if not check_credentials(network_config):
-        print("\n   ❌ Please update credentials in config.yaml")
+    if not check_credentials(network_config, verbose):
+        print(f"\n   {_ERR} Please update credentials in config.yaml")
         return
     
     # ========================================
     # Step 3: Initialize Fetcher
     # ========================================
-    print_separator("🔧 INITIALIZE FETCHER")
+    print_separator("INITIALIZE FETCHER")
     
     # UPDATE THESE PARAMETERS BASED ON NETWORK
     fetcher = NetworkNameFetcher(
@@ -143,22 +213,24 @@ async def main():
         app_ids=network_config.get('app_ids'),
     )
     
-    print(f"   ✅ Fetcher initialized: {fetcher.get_network_name()}")
-    print(f"   ✅ Network enum: {fetcher.get_network_enum()}")
+    print(f"   {_OK} Fetcher initialized: {fetcher.get_network_name()}")
+    print(f"   {_OK} Network enum: {fetcher.get_network_enum()}")
     
     try:
         # ========================================
         # Step 4: Auth Test
         # ========================================
-        if hasattr(fetcher, '_test_auth'):
+        # The report request fails loudly on bad credentials, so the extra
+        # auth round-trip only runs when explicitly requested
+        if hasattr(fetcher, '_test_auth') and (auth_only or check_auth):
             auth_success = await fetcher._test_auth()
             
             if not auth_success:
-                print("\n   ❌ Auth test failed - fix credentials before continuing")
+                print(f"\n   {_ERR} Auth test failed - fix credentials before continuing")
                 return
             
             if auth_only:
-                print("\n   ✅ Auth test passed (--auth-only mode)")
+                print(f"\n   {_OK} Auth test passed (--auth-only mode)")
                 return
         
         # ========================================
@@ -167,16 +239,16 @@ async def main():
         end_date = datetime.now(timezone.utc) - timedelta(days=1)
         start_date = end_date
         
-        print(f"\n📅 Date Range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        print(f"\n{_INFO} Date Range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
         
         if hasattr(fetcher, '_test_report_request') and not full_fetch:
             # Debug mode - use test method
             response_data = await fetcher._test_report_request(start_date, end_date)
             
             if response_data:
-                print("\n" + "="*60)
-                print("📋 RESPONSE STRUCTURE ANALYSIS")
-                print("="*60)
+                print("\n" + _BAR)
+                print("RESPONSE STRUCTURE ANALYSIS")
+                print(_BAR)
                 
                 def analyze_structure(obj, prefix=""):
                     if isinstance(obj, dict):
@@ -192,22 +264,22 @@ async def main():
                 analyze_structure(response_data)
         else:
             # Full fetch mode
-            print_separator("🚀 FULL DATA FETCH")
+            print_separator("FULL DATA FETCH")
             
             data = await fetcher.fetch_data(start_date, end_date)
             print_results(data)
         
-        print_separator("✅ TEST COMPLETED SUCCESSFULLY", "=")
+        print_separator(f"{_OK} TEST COMPLETED SUCCESSFULLY", "=")
         
     except Exception as e:
-        print_separator("❌ TEST FAILED", "=")
+        print_separator(f"{_ERR} TEST FAILED", "=")
         print(f"\n   Error: {str(e)}")
         import traceback
         traceback.print_exc()
     finally:
-        # ⚠️ Important: Close the aiohttp session
+        # Important: Close the aiohttp session
         await fetcher.close()
-        print("\n   🔒 Session closed")
+        print(f"\n   {_INFO} Session closed")
 
 
 if __name__ == "__main__":